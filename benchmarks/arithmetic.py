@@ -0,0 +1,42 @@
+"""
+Benchmark of Unum arithmetic operators on scalar values.
+
+Measures the per-operation overhead, which dominates calculations on plain numbers.
+
+Run: python benchmarks/arithmetic.py
+"""
+from __future__ import print_function, division
+
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)  # unum of this checkout, without installing it
+
+SETUP = 'from unum.units import m, s, kg, N, km; a, b = 2.0 * m, 3.0 * km'
+
+STATEMENTS = [
+    '3.0 * m',
+    'm * 3.0',
+    'a + a',
+    'a + b',
+    'a / (4.0 * s)',
+    'a < b',
+    'a ** 2',
+    '1 / a',
+    '(5.0 * kg * m / s ** 2) == 5.0 * N',
+]
+
+
+def main(repeat=5, number=100000):
+    print('%-38s %12s' % ('operation', 'best [us]'))
+
+    for statement in STATEMENTS:
+        times = timeit.repeat(statement, SETUP, repeat=repeat, number=number)
+
+        print('%-38s %12.3f' % (statement, min(times) / number * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark of the binary codec (unum.codec) against JSON of lists made by unum.utils.encode.
+
+Encodes 100000 scalar readings with a few units, and one array reading.
+
+Run: python benchmarks/codec.py
+"""
+from __future__ import print_function, division
+
+import json
+import os
+import random
+import sys
+import timeit
+
+import numpy
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)  # unum of this checkout, without installing it
+
+from unum import codec
+from unum.units import A, V, W, m, s
+from unum.utils import decode, encode
+
+UNITS = [m, m / s, A, V, W]
+
+
+def json_dumps(values):
+    items = [encode(value) for value in values]
+    return json.dumps([[value.tolist(), unit] if isinstance(value, numpy.ndarray) else [value, unit]
+                       for value, unit in items])
+
+
+def json_loads(data):
+    return [decode(item) for item in json.loads(data)]
+
+
+def main(size=100000, repeat=3):
+    random.seed(0)
+    datasets = [
+        ('scalars', [random.random() * random.choice(UNITS) for _ in range(size)]),
+        ('array', [V * numpy.random.random(size)]),
+    ]
+
+    print('%-20s %12s %12s %12s' % ('data, format', 'size [B]', 'encode [ms]', 'decode [ms]'))
+
+    for label, values in datasets:
+        for name, dumps, loads in [('json', json_dumps, json_loads), ('binary', codec.dumps, codec.loads)]:
+            data = dumps(values)
+            assert all(numpy.all(a == b) for a, b in zip(loads(data), values))
+
+            encoding = min(timeit.repeat(lambda: dumps(values), number=1, repeat=repeat))
+            decoding = min(timeit.repeat(lambda: loads(data), number=1, repeat=repeat))
+
+            print('%-20s %12d %12.1f %12.1f' % ('%s, %s' % (label, name), len(data), encoding * 1e3, decoding * 1e3))
+
+
+if __name__ == '__main__':
+    main()
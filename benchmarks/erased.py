@@ -0,0 +1,71 @@
+"""
+Benchmark of the gravity example (docs/gravity_example.py) with checked and erased units.
+
+The same calculation is run in two processes, the second with UNUM_ERASE_UNITS=1,
+where units are plain floats scaled to SI units.
+
+Run: python benchmarks/erased.py
+"""
+from __future__ import print_function, division
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CODE = '''
+import timeit
+from unum.units import *
+from unum.utils import as_number
+
+G = 6.6720E-11 * N * m ** 2 / kg ** 2
+earth_mass = 5.980E24 * kg
+c = 299792458 * m / s
+earth_radius = 6.37E+06 * m
+
+distances = (5 * cm, earth_radius, c * 365 * 24 * h)
+masses = (5 * g, earth_mass, 1000 * earth_mass)
+
+
+def gravity():
+    results = []
+
+    for m1 in masses:
+        for m2 in masses:
+            if m1 >= m2:
+                for d in distances:
+                    force = G * m1 * m2 / d ** 2
+                    results.append((as_number(force, N), as_number(force / m1, m / s ** 2), as_number(force / m2, m / s ** 2)))
+
+    return results
+
+
+print(repr(gravity()[-1]))
+print(min(timeit.repeat(gravity, repeat=5, number=%d)) / %d)
+'''
+
+
+def run(number, erased):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+
+    if erased:
+        env['UNUM_ERASE_UNITS'] = '1'
+
+    output = subprocess.check_output([sys.executable, '-c', CODE % (number, number)], env=env).decode()
+    result, time = output.splitlines()[-2:]
+
+    return result, float(time)
+
+
+def main(number=200):
+    print('%-8s %14s  %s' % ('units', 'best [us]', 'last result (f, a1, a2)'))
+
+    for label, erased in [('checked', False), ('erased', True)]:
+        result, time = run(number, erased)
+
+        print('%-8s %14.1f  %s' % (label, time * 1e6, result))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Import time of unum.units.
+
+Every statement is run in a fresh interpreter. Target: loading unit modules
+needed by a single base unit (time above plain `import unum`) must take at most
+TARGET_RATIO of the time of loading all units by star-import.
+
+Run: python benchmarks/import_time.py
+"""
+from __future__ import print_function, division
+
+import os
+import subprocess
+import sys
+
+STATEMENTS = [
+    ('import unum', 'import unum'),
+    ('import unum.units', 'import unum.units'),
+    ('one base unit', 'from unum.units import m'),
+    ('one derived unit', 'from unum.units import N'),
+    ('star-import', 'from unum.units import *'),
+]
+
+TARGET_RATIO = 0.5
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(statement, repeat):
+    code = 'import time; _start = time.perf_counter(); %s; print(time.perf_counter() - _start)' % statement
+    env = dict(os.environ, PYTHONPATH=ROOT)
+
+    times = [
+        float(subprocess.check_output([sys.executable, '-c', code], env=env))
+        for _ in range(repeat)
+    ]
+
+    return min(times)
+
+
+def main(repeat=30):
+    results = {}
+
+    for label, statement in STATEMENTS:
+        results[label] = measure(statement, repeat)
+        print('%-20s %8.2f ms' % (label, results[label] * 1e3))
+
+    base = results['import unum']
+    ratio = (results['one base unit'] - base) / (results['star-import'] - base)
+    print('units loading: one base unit / star-import = %.2f (target <= %.2f): %s' % (
+        ratio, TARGET_RATIO, 'OK' if ratio <= TARGET_RATIO else 'FAILED'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark of scatter-style updates of a large array-backed Unum with __setitem__.
+
+Every statement assigns values in km to an array in m, by slice, boolean mask or integer indexes.
+
+Run: python benchmarks/setitem.py
+"""
+from __future__ import print_function, division
+
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)  # unum of this checkout, without installing it
+
+SETUP = '''
+import numpy
+from unum.units import m, km
+from unum.utils import as_unum
+
+size = 1000000
+target = as_unum(m * numpy.zeros(size))
+values = km * numpy.random.random(size // 10)
+indexes = numpy.random.randint(0, size, size // 10)
+mask = numpy.zeros(size, bool)
+mask[indexes] = True
+masked = km * numpy.random.random(mask.sum())
+'''
+
+STATEMENTS = [
+    'target[:size // 10] = values',
+    'target[indexes] = values',
+    'target[mask] = masked',
+    'target[::2] = 5 * km',
+    'target[12345] = 5 * km',
+]
+
+
+def main(repeat=5, number=100):
+    print('%-38s %12s' % ('operation', 'best [us]'))
+
+    for statement in STATEMENTS:
+        times = timeit.repeat(statement, SETUP, repeat=repeat, number=number)
+
+        print('%-38s %12.3f' % (statement, min(times) / number * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Worst case benchmark of Unum.simplify_unit.
+
+Every combination is simplified with an empty SIMPLIFY_CACHE, so the full
+substitution search is measured.
+
+Run: python benchmarks/simplify.py
+"""
+from __future__ import print_function, division
+
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)  # unum of this checkout, without installing it
+
+import unum
+from unum.units import *
+from unum.units.custom.mechanical import gf, kgf
+
+PATHOLOGICAL = [
+    ('kNm*MPa/kgf/Wb', kNm * MPa / kgf / Wb),
+    ('MNm*GPa/kN/T', MNm * GPa / kN / T),
+    ('kNcm*kPa/gf/HENRY', kNcm * kPa / gf / HENRY),
+    ('J*W/kNm/ohm', J * W / kNm / ohm),
+    ('V*F*S/MN/lx', V * F * S / MN / lx),
+    ('Wb*kat/kgf/Gy/Sv', Wb * kat / kgf / Gy / Sv),
+    ('kNm*C*Hz/MPa/HENRY/lm', kNm * C * Hz / MPa / HENRY / lm),
+]
+
+
+def simplify(value):
+    unum.SIMPLIFY_CACHE.clear()
+    value.copy().simplify_unit()
+
+
+def main(repeat=5, number=3):
+    print('%-22s %-28s %12s' % ('unit', 'simplified', 'worst [ms]'))
+
+    for label, value in PATHOLOGICAL:
+        times = timeit.repeat(lambda: simplify(value), repeat=repeat, number=number)
+        simplified = unum.Unum.formatter.format_unit(value.copy(normalized=True))
+
+        print('%-22s %-28s %12.3f' % (label, simplified, max(times) / number * 1e3))
+
+
+if __name__ == '__main__':
+    main()
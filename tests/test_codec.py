@@ -0,0 +1,70 @@
+from __future__ import unicode_literals, absolute_import
+
+import io
+import unittest
+
+import numpy
+
+import unum
+from unum.codec import Decoder, Encoder, dumps, loads
+from unum.units import *
+
+
+class CodecTest(unittest.TestCase):
+    def test_Loads_DumpedScalars_ReturnEqualValuesOfSameTypes(self):
+        values = [2 * m, 3.5 * m / s, 0.1 * m, 7, 2.5]
+
+        result = loads(dumps(values))
+
+        self.assertEqual(values, result)
+        self.assertEqual([int, float, float, int, float], [type(unum.Unum.uniform(item)._value) for item in result])
+
+    def test_Loads_DumpedArray_ReturnEqualArray(self):
+        value = m * numpy.arange(6, dtype=numpy.int32).reshape(2, 3)
+
+        result, = loads(dumps([value]))
+
+        self.assertEqual(m, result.unit())
+        self.assertEqual(numpy.int32, result._value.dtype)
+        numpy.testing.assert_array_equal(value._value, result._value)
+
+    def test_Loads_DumpedStructuredArray_ReturnEqualArray(self):
+        dtype = numpy.dtype([('x', '>f8'), ('n', '<i2', (2,))] + [('field%d' % i, 'u1') for i in range(30)])
+        value = numpy.zeros(3, dtype)
+        value['x'], value['n'] = [1.5, 2.5, 3.5], [[1, 2], [3, 4], [5, 6]]
+
+        result, = loads(dumps([value]))
+
+        self.assertEqual(dtype.names, result.dtype.names)
+        self.assertEqual(numpy.dtype('=f8'), result.dtype['x'])
+        numpy.testing.assert_array_equal(value, result)
+
+    def test_Dumps_StructuredArrayWithObjects_Throws(self):
+        with self.assertRaises(TypeError):
+            dumps([numpy.zeros(2, [('x', 'f8'), ('o', 'O')])])
+
+    def test_Dumps_ManyValuesWithSameUnit_WriteUnitOnce(self):
+        data = dumps([float(number) * kg * m / s ** 2 for number in range(100)])
+
+        self.assertEqual(1, data.count(b'"kg"'))
+
+    def test_Decoder_ValuesWrittenByEncoder_ReadAllValues(self):
+        stream = io.BytesIO()
+        encoder = Encoder(stream)
+        encoder.write(2 * m)
+        encoder.write_many([1.5 * km, 2.5 * m])
+        stream.seek(0)
+
+        result = list(Decoder(stream))
+
+        self.assertEqual([2 * m, [1.5 * km, 2.5 * m]], result)
+
+    def test_Loads_UnknownUnit_Throws(self):
+        data = dumps([unum.Unum(2., {'not defined unit': 1})])
+
+        with self.assertRaises(unum.UnknownUnitError):
+            loads(data)
+
+    def test_Dumps_NotSupportedValue_Throws(self):
+        with self.assertRaises(TypeError):
+            dumps([(1 + 2j) * m])
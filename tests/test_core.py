@@ -1,7 +1,10 @@
 from __future__ import unicode_literals, absolute_import
 
+import copy
 import math
+import pickle
 import unittest
+import weakref
 from fractions import Fraction
 
 import numpy
@@ -78,16 +81,26 @@ class UnumTest(unittest.TestCase):
 
         self.assertEqual(Fraction(25, 36) * km ** 2, result)
 
+    def test_EraseUnits_UnitsDefined_Throws(self):
+        with self.assertRaises(unum.UnumError):
+            unum.erase_units()
+
     def test_Multiplying_UnitByFraction_ReturnFractionWithUnit(self):
         result = km * Fraction(1, 2)
 
         self.assertEqual(Fraction(1, 2) * km, result)
 
-    def test_Multiplying_NumpyArrayByUnit_ReturnNumpyArrayWithNumbersWithUnit(self):
+    def test_Multiplying_NumpyArrayByUnit_ReturnUnumWithNumpyArrayValue(self):
         result = numpy.array([2, 3, 4]) * ns
 
-        self.assertIsInstance(result, numpy.ndarray)
-        self.assertIsInstance(result[0], unum.Unum)
+        self.assertIsInstance(result, unum.Unum)
+        self.assertIsInstance(result.number(), numpy.ndarray)
+
+    def test_Division_NumpyArrayByUnit_ReturnUnumWithReciprocalUnit(self):
+        result = numpy.array([2., 4.]) / s
+
+        self.assertIsInstance(result, unum.Unum)
+        self.assertEqual(1 / s, result.unit())
 
     def test_Multiplying_UnitByNumpyArray_ReturnUnumWithNumpyArrayValue(self):
         result = as_unum(ns * numpy.array([2, 3, 4]))
@@ -160,6 +173,54 @@ class UnumTest(unittest.TestCase):
 
         self.assertEqual(unitless, value.unit())
 
+    def test_Expand_DerivedUnit_ReturnFactorAndBasicUnits(self):
+        expansion = unum.UNIT_TABLE.expand({'kN': 1, 'km': 1})
+
+        self.assertEqual({'kg': 1, 'm': 2, 's': -2}, expansion.unit)
+        self.assertEqual(1000000, expansion.factor)
+
+    def test_Number_DeepChainOfDefinitions_ReturnValueInBasicUnit(self):
+        from unum.units.imp_UK import lea
+
+        result = (2 * lea).number(m)
+
+        self.assertAlmostEqual(9656.064, result)
+
+    def test_MatchUnits_UnitsWithDifferentDimensions_Throws(self):
+        with self.assertRaises(unum.IncompatibleUnitsError):
+            (N * m).match_units(W)
+
+    def test_SimplifyUnit_ManyDerivedUnits_ReturnShortestUnit(self):
+        value = as_unum(2 * kNm * MPa / kG / Wb)
+
+        value.simplify_unit()
+
+        self.assertEqual(A / m ** 2, value.unit())
+
+    def test_SimplifyUnit_BudgetExceeded_ReturnExpansionToBasicUnits(self):
+        value = as_unum(2 * kNm * MPa / kG / Wb)
+        expected = value.copy(normalized=True)
+
+        unum.Unum.SIMPLIFY_BUDGET = 1
+        try:
+            value.simplify_unit()
+        finally:
+            unum.Unum.SIMPLIFY_BUDGET = None
+
+        self.assertEqual(A / m ** 2, value.unit())
+        self.assertAlmostEqual(expected.number(), value.number())
+
+    def test_SimplifyUnit_BudgetExceededAfterShorterUnitFound_ReturnFoundUnit(self):
+        value = as_unum(3 * J / N)
+
+        unum.Unum.SIMPLIFY_BUDGET = 2
+        try:
+            value.simplify_unit()
+        finally:
+            unum.Unum.SIMPLIFY_BUDGET = None
+
+        self.assertEqual(6 * m, value + value)
+
     def test_Equal_DifferentUnits_ReturnFalse(self):
         a = 5 * m
         b = 4 * K
@@ -193,6 +254,183 @@ class UnumTest(unittest.TestCase):
 
         assert a
 
+    def test_Addition_NumberToUnitless_ReturnUnitlessNumber(self):
+        result = 1 + 2 * m / m
+
+        self.assertEqual(3, result)
+        self.assertIs(unum.EMPTY_SIGNATURE, result._unit)
+
+    def test_Addition_NumberToUnitWithValue_Throws(self):
+        with self.assertRaises(unum.IncompatibleUnitsError):
+            _ = 2 * m + 1
+
+    def test_Sum_UnumsWithSameUnit_ReturnUnumWithUnit(self):
+        result = sum([2 * m, 3 * m])
+
+        self.assertEqual(5 * m, result)
+
+    def test_Division_NumberByUnum_ReturnReciprocalUnit(self):
+        result = 1 / (2. * s)
+
+        self.assertEqual(0.5 / s, result)
+        self.assertIs((s ** -1)._unit, result._unit)
+
+    def test_Multiplying_UnumByNumber_KeepUnitSignature(self):
+        self.assertIs(m._unit, (3 * m * 2.5)._unit)
+
+    def test_Number_ArrayToOtherUnit_ReturnConvertedArray(self):
+        result = (m * numpy.array([1000., 2000.])).number(km)
+
+        self.assertEqual([1., 2.], list(result))
+
+    def test_Str_ArrayValue_ReturnArrayAndUnit(self):
+        self.assertEqual('[1. 2.] [m]', str(m * numpy.array([1., 2.])))
+
+    def test_Addition_ZeroArrayAndArrayOfOtherUnit_ReturnSumOfArrays(self):
+        result = m * numpy.zeros(2) + km * numpy.array([1., 2.])
+
+        self.assertEqual([1000., 2000.], list(result.number(m)))
+
+    def test_InplaceAddition_FloatArrayAndOtherUnit_UpdateArrayInUnitOfLeftOperand(self):
+        value = m * numpy.array([1., 2.])
+        array = value._value
+
+        value += km * numpy.array([1., 2.])
+
+        self.assertIs(array, value._value)
+        self.assertEqual([1001., 2002.], list(value.number(m)))
+        self.assertIs(m._unit, value._unit)
+
+    def test_InplaceSubtraction_IncompatibleUnits_Throws(self):
+        value = m * numpy.array([1., 2.])
+
+        with self.assertRaises(unum.IncompatibleUnitsError):
+            value -= 1 * s
+
+    def test_InplaceMultiplication_FloatArray_UpdateArrayAndUnit(self):
+        value = m * numpy.array([1., 2.])
+        array = value._value
+
+        value *= 2 / s
+
+        self.assertIs(array, value._value)
+        self.assertEqual([2., 4.], list(value.number(m / s)))
+
+    def test_InplaceDivision_IntArray_ReturnNewUnumWithFloatArray(self):
+        value = m * numpy.array([1, 2])
+        array = value._value
+
+        value /= 2
+
+        self.assertEqual([1, 2], list(array))
+        self.assertEqual([0.5, 1.], list(value.number(m)))
+
+    def test_InplaceAddition_Number_NotModifyOriginalUnum(self):
+        value = original = 2 * m
+
+        value += 3 * m
+
+        self.assertEqual(2 * m, original)
+        self.assertEqual(5 * m, value)
+
+    def test_Iter_ArrayValue_YieldUnumsSharingUnitSignature(self):
+        value = as_unum(m * numpy.array([1., 2.]))
+
+        result = list(value)
+
+        self.assertEqual([1 * m, 2 * m], result)
+        self.assertTrue(all(item._unit is value._unit for item in result))
+
+    def test_ToList_TwoDimensionalArray_ReturnNestedListOfUnumsWithNumbers(self):
+        result = as_unum(m * numpy.array([[1., 2.], [3., 4.]])).tolist()
+
+        self.assertEqual([[1 * m, 2 * m], [3 * m, 4 * m]], result)
+        self.assertIsInstance(result[1][0]._value, float)
+
+    def test_Chunks_ArrayValue_YieldViewsOfGivenSize(self):
+        value = as_unum(m * numpy.arange(5.))
+
+        result = list(value.chunks(2))
+
+        self.assertEqual([2, 2, 1], [len(chunk) for chunk in result])
+        self.assertTrue(numpy.shares_memory(value._value, result[1]._value))
+        self.assertEqual(m, result[2].unit())
+
+    def test_SetItem_BooleanMaskAndCompatibleUnit_AssignConvertedValues(self):
+        value = as_unum(m * numpy.zeros(4))
+
+        value[numpy.array([True, False, True, False])] = km * numpy.array([1., 2.])
+
+        self.assertEqual([1000., 0., 2000., 0.], list(value._value))
+
+    def test_SetItem_SliceAndNumberWithUnit_BroadcastConvertedValue(self):
+        value = as_unum(m * numpy.zeros(4))
+
+        value[1:] = 5 * cm
+
+        self.assertEqual([0., .05, .05, .05], list(value._value))
+
+    def test_SetItem_IncompatibleUnit_Throws(self):
+        value = as_unum(m * numpy.zeros(4))
+
+        with self.assertRaises(unum.IncompatibleUnitsError):
+            value[[0, 2]] = 5 * s
+
+    def test_Pickle_Number_ReturnEqualUnum(self):
+        result = pickle.loads(pickle.dumps(2.5 * m / s))
+
+        self.assertEqual(2.5 * m / s, result)
+
+    def test_Pickle_ManyNumbersOfOneUnit_WriteUnitOnce(self):
+        data = pickle.dumps([i * m / s for i in range(100)], protocol=2)
+
+        self.assertEqual(1, data.count(b'_registered_signature'))
+        self.assertEqual(list(range(100)), [value.number(m / s) for value in pickle.loads(data)])
+
+    def test_Pickle_Number_ReturnInternedUnit(self):
+        result = pickle.loads(pickle.dumps(2.5 * m / s))
+
+        self.assertIs((m / s)._unit, result._unit)
+
+    def test_Unpickle_UnknownUnit_Throws(self):
+        data = pickle.dumps(unum.Unum(2, {'zzq': 1}))
+
+        with self.assertRaises(unum.UnknownUnitError):
+            pickle.loads(data)
+
+    def test_DeepCopy_UnknownUnit_ReturnEqualUnumWithSameUnit(self):
+        value = unum.Unum(2, {'zzq': 1})
+
+        result = copy.deepcopy(value)
+
+        self.assertIs(value._unit, result._unit)
+        self.assertEqual(2, result._value)
+
+    def test_Copy_Number_ReturnUnumWithSameUnit(self):
+        value = 2.5 * m / s
+
+        self.assertIs(value._unit, copy.copy(value)._unit)
+
+    @unittest.skipIf(pickle.HIGHEST_PROTOCOL < 5, "pickle protocol 5 isn't supported")
+    def test_Pickle_ArrayWithProtocol5_PassArrayDataOutOfBand(self):
+        value = as_unum(m * numpy.arange(6.).reshape(2, 3))
+        buffers = []
+
+        data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        result = pickle.loads(data, buffers=buffers)
+
+        self.assertEqual(1, len(buffers))
+        self.assertTrue(numpy.shares_memory(value._value, result._value))
+        self.assertEqual(m, result.unit())
+
+    @unittest.skipIf(pickle.HIGHEST_PROTOCOL < 5, "pickle protocol 5 isn't supported")
+    def test_Pickle_FortranArrayWithProtocol5_ReturnEqualArray(self):
+        value = as_unum(m * numpy.asfortranarray(numpy.arange(6.).reshape(2, 3)))
+
+        result = pickle.loads(pickle.dumps(value, protocol=5))
+
+        numpy.testing.assert_array_equal(value._value, result._value)
+
     @classmethod
     def setUpClass(cls):
         unum.Unum.set_format(superscript=False, mul_separator='.')
@@ -202,6 +440,179 @@ class UnumTest(unittest.TestCase):
         unum.Unum.reset_format()
 
 
+class UnitSignatureTest(unittest.TestCase):
+    def test_New_EqualMappings_ReturnSameInstance(self):
+        self.assertIs(unum.UnitSignature({'m': 1, 's': -2}), unum.UnitSignature({'s': -2, 'm': 1}))
+
+    def test_Equal_DictWithSameItems_ReturnTrue(self):
+        self.assertEqual({'m': 1, 's': -2}, unum.UnitSignature({'m': 1, 's': -2}))
+
+    def test_SetItem_Always_Throws(self):
+        signature = unum.UnitSignature({'m': 1})
+
+        with self.assertRaises(TypeError):
+            signature['m'] = 2
+
+    def test_Multiply_ExponentsCancelOut_RemoveSymbol(self):
+        result = unum.UnitSignature({'m': 1, 's': -1}) * unum.UnitSignature({'s': 1})
+
+        self.assertIs(unum.UnitSignature({'m': 1}), result)
+
+    def test_Power_IntegralFloatExponent_StoreIntExponent(self):
+        result = unum.UnitSignature({'m': 2}) ** 0.5
+
+        self.assertEqual((('m', 1),), result.sorted_items)
+        self.assertIsInstance(result['m'], int)
+
+    def test_ConversionFactor_CompatibleUnits_ReturnFactor(self):
+        result = unum.UnitSignature({'km': 1}).conversion_factor(unum.UnitSignature({'m': 1}))
+
+        self.assertEqual(1000, result)
+
+    def test_ConversionFactor_IncompatibleUnits_ReturnNone(self):
+        result = unum.UnitSignature({'km': 1}).conversion_factor(unum.UnitSignature({'s': 1}))
+
+        self.assertIsNone(result)
+
+    def test_ConversionFactor_TableChanged_ComputeAgain(self):
+        table = unum.UNIT_TABLE.copy()
+        self.addCleanup(unum.UNIT_TABLE.reset, table)
+        source, target = unum.UnitSignature({'km': 1}), unum.UnitSignature({'conversion_unit': 1})
+        unum.new_unit('conversion_unit')
+        self.assertIsNone(source.conversion_factor(target))
+
+        unum.UNIT_TABLE.reset(table)
+        unum.new_unit('conversion_unit', 10 * m)
+
+        self.assertAlmostEqual(100, source.conversion_factor(target))
+
+    def test_Power_ManyDistinctExponents_NotKeepResultsAlive(self):
+        signature = unum.UnitSignature({'m': 1})
+        first = weakref.ref(signature ** 1.000001)
+
+        for i in range(2, 2 * unum.SIGNATURE_CACHE_SIZE):
+            signature ** (1 + i / 1e6)
+
+        self.assertIsNone(first())
+
+    def test_Multiply_ManyDistinctSignatures_NotKeepThemAlive(self):
+        signature, other = unum.UnitSignature({'m': 1}), unum.UnitSignature({'s': 1.000001})
+        signature * other
+        first = weakref.ref(other)
+        del other
+
+        for i in range(2, 2 * unum.SIGNATURE_CACHE_SIZE):
+            signature * unum.UnitSignature({'s': 1 + i / 1e6})
+
+        self.assertIsNone(first())
+
+    def test_Multiplying_UnumsWithSameUnit_ShareUnitSignature(self):
+        self.assertIs((2 * m / s)._unit, (m * 3 / s)._unit)
+
+
+class UnitTableTest(unittest.TestCase):
+    def test_Contains_PrefixedPrefixableUnit_ReturnTrue(self):
+        table = self.create()
+
+        self.assertIn('kpu', table)
+
+    def test_Contains_PrefixedNotPrefixableUnit_ReturnFalse(self):
+        table = self.create()
+        table.new_unit('npu')
+
+        self.assertNotIn('knpu', table)
+
+    def test_GetItem_PrefixedUnit_ReturnDefinitionByBaseUnit(self):
+        table = self.create()
+
+        result = table['kpu']
+
+        self.assertEqual('kilopunit', result.name)
+        self.assertEqual(1, result.level)
+        self.assertEqual(1000, result.expansion.factor)
+
+    def test_GetItem_UnknownUnit_Throws(self):
+        table = self.create()
+
+        with self.assertRaises(unum.UnknownUnitError):
+            _ = table['xpu']
+
+    def test_NewUnit_PrefixedSymbolOfPrefixableUnit_Throws(self):
+        table = self.create()
+
+        with self.assertRaises(unum.NameConflictError):
+            table.new_unit('kpu')
+
+    def test_Reset_Always_RemovePrefixes(self):
+        table = self.create()
+
+        table.reset()
+        table.new_prefix('k', 10, 3, 'kilo')
+
+        self.assertEqual({'k'}, set(table.prefixes))
+
+    def test_Reset_CopyOfTable_RestoreUnitsAndPrefixes(self):
+        table = self.create()
+        copy = table.copy()
+        table.new_prefix('M', 10, 6, 'mega')
+
+        table.reset(copy)
+
+        self.assertEqual({'k'}, set(table.prefixes))
+        self.assertEqual('kilopunit', table['kpu'].name)
+        self.assertNotIn('Mpu', table)
+
+    def test_Number_DifferentPrefixesOfSameUnit_ReturnValueMultipliedByPowerOfTen(self):
+        self.assertAlmostEqual(3e6, (3 * km).number(mm))
+
+    @staticmethod
+    def create():
+        table = unum.UnitTable()
+        table.new_prefix('k', 10, 3, 'kilo')
+        table.new_unit('pu', 0, 'punit', prefixable=True)
+        return table
+
+
+class UnitCacheTest(unittest.TestCase):
+    def test_GetItem_StoredKey_ReturnStoredValue(self):
+        cache = self.create()
+        cache['a'] = 1
+
+        self.assertEqual(1, cache['a'])
+
+    def test_SetItem_MaxSizeExceeded_EvictLeastRecentlyUsed(self):
+        cache = self.create(max_size=2)
+        cache['a'], cache['b'] = 1, 2
+        _ = cache['a']
+
+        cache['c'] = 3
+
+        self.assertEqual(2, len(cache))
+        with self.assertRaises(KeyError):
+            _ = cache['b']
+
+    def test_GetItem_TableChanged_Throws(self):
+        table = unum.UnitTable()
+        cache = unum.UnitCache(table)
+        cache['a'] = 1
+
+        table.new_unit('cache_unit')
+
+        with self.assertRaises(KeyError):
+            _ = cache['a']
+
+    def test_SimplifyUnit_Always_StoreResultInCache(self):
+        unit = {'J': 1, 'cm': -1}
+
+        unum.Unum(2, unit).simplify_unit()
+
+        self.assertEqual(({'N': 1}, 100), unum.SIMPLIFY_CACHE[unum.UnitSignature(unit), False, None])
+
+    @staticmethod
+    def create(max_size=1024):
+        return unum.UnitCache(unum.UnitTable(), max_size)
+
+
 class FormatterTest(unittest.TestCase):
     def test_Format_ByDefault_UseDots(self):
         formatter = self.create()
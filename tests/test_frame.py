@@ -0,0 +1,95 @@
+from __future__ import unicode_literals, absolute_import
+
+import unittest
+
+import numpy
+
+import unum
+from unum.frame import QuantityFrame
+from unum.units import *
+
+
+class QuantityFrameTest(unittest.TestCase):
+    def setUp(self):
+        self.frame = QuantityFrame([
+            ('distance', km * numpy.array([12., 30., 5.])),
+            ('time', h * numpy.array([.25, .5, .2])),
+        ])
+
+    def test_GetItem_ColumnName_ReturnUnumWrappingStoredArray(self):
+        result = self.frame['distance']
+
+        self.assertIsInstance(result, unum.Unum)
+        self.assertIs(self.frame.number('distance'), result._value)
+        self.assertEqual(km, result.unit())
+
+    def test_SetItem_ResultOfColumnArithmetic_StoreColumnWithPropagatedUnit(self):
+        self.frame['speed'] = self.frame['distance'] / self.frame['time']
+
+        self.assertEqual(km / h, self.frame.unit('speed'))
+        numpy.testing.assert_allclose([48., 60., 25.], self.frame.number('speed'))
+
+    def test_SetItem_DifferentLength_Throws(self):
+        with self.assertRaises(ValueError):
+            self.frame['mass'] = kg * numpy.array([1., 2.])
+
+    def test_SetItem_ListOfUnums_StoreArrayInUnitOfFirst(self):
+        self.frame['mass'] = [1 * kg, 2 * kg, 500 * g]
+
+        self.assertEqual(kg, self.frame.unit('mass'))
+        numpy.testing.assert_allclose([1., 2., .5], self.frame.number('mass'))
+
+    def test_SetItem_ListOfIncompatibleUnums_Throws(self):
+        with self.assertRaises(unum.IncompatibleUnitsError):
+            self.frame['mass'] = [1 * kg, 2 * kg, 3 * m]
+
+    def test_Init_KeywordColumns_KeepOrderOfArguments(self):
+        frame = QuantityFrame(time=h * numpy.array([1.]), distance=km * numpy.array([2.]))
+
+        self.assertEqual(['time', 'distance'], frame.keys())
+
+    def test_GetItem_Slice_ReturnFrameOfViews(self):
+        result = self.frame[1:]
+
+        self.assertEqual(2, len(result))
+        self.assertTrue(numpy.shares_memory(self.frame.number('time'), result.number('time')))
+
+    def test_GetItem_BooleanMask_ReturnFilteredRows(self):
+        result = self.frame[self.frame['distance'] > 10000 * m]
+
+        numpy.testing.assert_allclose([.25, .5], result.number('time'))
+
+    def test_GetItem_RowIndex_ReturnUnumsOfRow(self):
+        result = self.frame[-1]
+
+        self.assertEqual(['distance', 'time'], list(result))
+        self.assertEqual(5 * km, result['distance'])
+        self.assertEqual(.2 * h, result['time'])
+
+    def test_GetItem_RowIndexOutOfRange_Throws(self):
+        with self.assertRaises(IndexError):
+            self.frame[3]
+
+    def test_GetItem_Float_Throws(self):
+        with self.assertRaises(TypeError):
+            self.frame[1.5]
+
+    def test_Str_LongFrame_PrintFirstAndLastRows(self):
+        frame = QuantityFrame(distance=m * numpy.arange(1000.))
+
+        lines = str(frame).splitlines()
+
+        self.assertEqual(22, len(lines))
+        self.assertEqual(['0.0', '9.0', '...', '990.0', '999.0'],
+                         [lines[index].strip() for index in (1, 10, 11, 12, 21)])
+
+    def test_CastUnit_CompatibleUnit_ReturnFrameWithConvertedColumn(self):
+        result = self.frame.cast_unit('distance', m)
+
+        self.assertEqual(m, result.unit('distance'))
+        numpy.testing.assert_allclose([12000., 30000., 5000.], result.number('distance'))
+        self.assertEqual(km, self.frame.unit('distance'))
+
+    def test_CastUnit_IncompatibleUnit_Throws(self):
+        with self.assertRaises(unum.IncompatibleUnitsError):
+            self.frame.cast_unit('distance', s)
@@ -0,0 +1,78 @@
+from __future__ import unicode_literals, absolute_import
+
+import io
+import json
+import unittest
+
+import numpy
+
+import unum
+from unum.jsoncodec import UnumEncoder, dump, dumps, load, loads, object_pairs_hook
+from unum.units import *
+
+
+class JsonCodecTest(unittest.TestCase):
+    def test_Loads_DumpedDocument_ReturnEqualUnums(self):
+        document = {'span': 2 * m, 'loads': [1.5 * kN, 2 * kN / m]}
+
+        result = loads(dumps(document))
+
+        self.assertEqual(document, result)
+
+    def test_Loads_DumpedArray_ReturnUnumWithNumpyArray(self):
+        result = loads(dumps({'loads': kN * numpy.array([1., 2.5])}))['loads']
+
+        self.assertEqual(kN, result.unit())
+        numpy.testing.assert_array_equal([1., 2.5], result._value)
+
+    def test_IterEncode_ArrayLongerThanChunk_YieldArrayInParts(self):
+        encoder = UnumEncoder()
+        encoder.CHUNK_SIZE = 2
+
+        result = list(encoder.iterencode(m * numpy.arange(5.)))
+
+        self.assertIn('2.0, 3.0', result)
+        numpy.testing.assert_array_equal(numpy.arange(5.), loads(''.join(result)).number(m))
+
+    def test_Dump_Iterator_WriteListOfItems(self):
+        stream = io.StringIO()
+
+        dump({'readings': (number * m for number in range(3))}, stream)
+        stream.seek(0)
+
+        self.assertEqual([0 * m, 1 * m, 2 * m], load(stream)['readings'])
+
+    def test_Dumps_StringLikePlaceholderWithIterator_WriteStringUnchanged(self):
+        for kwargs in [{}, {'indent': 2}, {'ensure_ascii': False}]:
+            document = {'note': '\x00unum:0\x00', 'x': iter([1]), '\x000\x00': '\x000\x00'}
+
+            result = json.loads(dumps(document, **kwargs))
+
+            self.assertEqual({'note': '\x00unum:0\x00', 'x': [1], '\x000\x00': '\x000\x00'}, result)
+
+    def test_Dumps_NotFiniteFloatWithIndent_WriteLikeJson(self):
+        document = [float('nan'), float('inf'), -float('inf'), 0.1]
+
+        self.assertEqual(json.dumps(document, indent=1), dumps(document, indent=1))
+
+        with self.assertRaises(ValueError):
+            dumps(document, indent=1, allow_nan=False)
+
+    def test_ObjectPairsHook_EncodedUnum_ReturnUnum(self):
+        result = json.loads(dumps([3 * s]), object_pairs_hook=object_pairs_hook)
+
+        self.assertEqual([3 * s], result)
+
+    def test_Loads_UnknownUnit_Throws(self):
+        with self.assertRaises(unum.UnknownUnitError):
+            loads('{"__unum__": 2, "unit": {"not defined unit": 1}}')
+
+    def test_Dump_ArraysInNestedContainersWithIndent_WriteLikeJsonOfLists(self):
+        document = {'a': [numpy.arange(3.), {'b': iter([m * numpy.ones(2)])}], 'c': 'text'}
+        stream = io.StringIO()
+
+        dump(document, stream, indent=2, sort_keys=True)
+        stream.seek(0)
+
+        expected = {'a': [[0., 1., 2.], {'b': [{'__unum__': [1., 1.], 'unit': {'m': 1}}]}], 'c': 'text'}
+        self.assertEqual(expected, json.load(stream))
@@ -0,0 +1,67 @@
+from __future__ import unicode_literals, absolute_import
+
+import unittest
+
+import numpy
+
+import unum
+from unum.lazy import LazyUnum, lazy
+from unum.units import *
+
+
+class LazyUnumTest(unittest.TestCase):
+    def test_Multiplying_LazyUnumByUnum_NotComputeValue(self):
+        result = 0.5 * lazy(2 * kg) * (3 * m / s) ** 2
+
+        self.assertIsInstance(result, LazyUnum)
+        self.assertFalse(result.is_computed())
+
+    def test_Addition_IncompatibleUnits_ThrowsBeforeComputing(self):
+        with self.assertRaises(unum.IncompatibleUnitsError):
+            _ = lazy(2 * m) + 3 * s
+
+    def test_Addition_DifferentUnits_ReturnSumInMatchedUnit(self):
+        result = lazy(2 * m) + 3 * km
+
+        self.assertEqual(3.002 * km, result)
+        self.assertIs(km._unit, result._unit)
+
+    def test_Addition_Zero_ReturnLazyUnumInItsUnit(self):
+        result = lazy(2 * m) + 0
+
+        self.assertIsInstance(result, LazyUnum)
+        self.assertIs(m._unit, result._unit)
+        self.assertEqual(2 * m, result)
+
+    def test_Sum_LazyUnums_ReturnLazySum(self):
+        result = sum([lazy(2 * m), lazy(3 * km)])
+
+        self.assertIsInstance(result, LazyUnum)
+        self.assertAlmostEqual(3002, result.number(m))
+
+    def test_Number_ArrayLongerThanChunk_ReturnSameValuesAsUnum(self):
+        rho, v = kg / m ** 3 * numpy.linspace(1, 2, 1000), m / s * numpy.linspace(0, 30, 1000)
+        expected = (0.5 * rho * v ** 2).number(Pa)
+
+        result = 0.5 * lazy(rho) * v ** 2
+        self.set_chunk_size(64)
+
+        numpy.testing.assert_allclose(expected, result.number(Pa))
+
+    def test_Number_ArraysBroadcastAlongRows_ReturnBroadcastValues(self):
+        result = lazy(m * numpy.ones((100, 3))) + cm * numpy.arange(3.)
+        self.set_chunk_size(30)
+
+        numpy.testing.assert_allclose([1., 1.01, 1.02], result.number(m)[-1])
+
+    def test_InplaceAddition_LazyUnum_NotModifyOperand(self):
+        value = original = lazy(2 * m)
+
+        value += 3 * m
+
+        self.assertEqual(2 * m, original)
+        self.assertEqual(5 * m, value)
+
+    def set_chunk_size(self, size):
+        self.addCleanup(setattr, LazyUnum, 'CHUNK_SIZE', LazyUnum.CHUNK_SIZE)
+        LazyUnum.CHUNK_SIZE = size
@@ -0,0 +1,102 @@
+from __future__ import unicode_literals, absolute_import
+
+import unittest
+
+import numpy
+
+import unum
+from unum.units import *
+from unum.utils import as_unum
+
+
+class ArrayUfuncTest(unittest.TestCase):
+    def test_Sqrt_ArrayOfSquareMeters_ReturnArrayInMeters(self):
+        result = numpy.sqrt(as_unum(m ** 2 * numpy.array([1., 4., 9.])))
+
+        self.assertIs(m._unit, result._unit)
+        numpy.testing.assert_allclose([1., 2., 3.], result.number())
+
+    def test_Add_DifferentUnits_ReturnSumInMatchedUnit(self):
+        result = numpy.add(m * numpy.array([1., 2.]), km * numpy.array([1., 2.]))
+
+        numpy.testing.assert_allclose([1001., 2002.], result.number(m))
+
+    def test_Add_IncompatibleUnits_Throws(self):
+        with self.assertRaises(unum.IncompatibleUnitsError):
+            numpy.add(m * numpy.array([1., 2.]), s * numpy.array([1., 2.]))
+
+    def test_Greater_DifferentUnits_ReturnPlainBooleanArray(self):
+        result = numpy.greater(m * numpy.array([1., 2000.]), km)
+
+        numpy.testing.assert_array_equal([False, True], result)
+
+    def test_Equal_IncompatibleUnits_ReturnFalseArray(self):
+        result = numpy.equal(m * numpy.array([1., 2.]), s * numpy.array([1., 2.]))
+
+        self.assertEqual([False, False], result.tolist())
+
+    def test_NotEqual_IncompatibleUnits_ReturnTrueArray(self):
+        result = numpy.not_equal(m * numpy.array([[1.], [2.]]), 1 * s)
+
+        self.assertEqual([[True], [True]], result.tolist())
+
+    def test_Less_IncompatibleUnits_Throws(self):
+        with self.assertRaises(unum.IncompatibleUnitsError):
+            numpy.less(m * numpy.array([1., 2.]), s * numpy.array([1., 2.]))
+
+    def test_Cos_NamedDimensionlessUnit_ReturnPlainArray(self):
+        result = numpy.cos(deg * numpy.array([0., 180.]))
+
+        numpy.testing.assert_allclose([1., -1.], result)
+
+    def test_Cos_ValueWithUnit_Throws(self):
+        with self.assertRaises(unum.ShouldBeUnitlessError):
+            numpy.cos(m * numpy.array([0., 1.]))
+
+    def test_MultiplyReduce_ValueWithUnit_ReturnUnitToPowerOfSize(self):
+        result = numpy.multiply.reduce(m * numpy.array([1., 2., 3.]))
+
+        self.assertEqual(6 * m ** 3, result)
+
+    def test_Multiply_OutIsUnum_StoreResultInOutArray(self):
+        out = as_unum(m * numpy.zeros(2))
+        array = out._value
+
+        result = numpy.multiply(m * numpy.array([1., 2.]), 2 * s, out=(out,))
+
+        self.assertIs(out, result)
+        self.assertIs(array, out._value)
+        self.assertEqual(m * s, out.unit())
+
+
+class ArrayFunctionTest(unittest.TestCase):
+    def test_Sum_ArrayWithUnit_ReturnSumWithUnit(self):
+        result = numpy.sum(m * numpy.array([1., 2., 3.]))
+
+        self.assertEqual(6 * m, result)
+
+    def test_Var_ArrayWithUnit_ReturnSquaredUnit(self):
+        result = numpy.var(m * numpy.array([1., 3.]))
+
+        self.assertEqual(1 * m ** 2, result)
+
+    def test_Concatenate_DifferentUnits_ReturnArrayInUnitOfFirst(self):
+        result = numpy.concatenate([m * numpy.array([1., 2.]), km * numpy.array([1.])])
+
+        self.assertIs(m._unit, result._unit)
+        numpy.testing.assert_allclose([1., 2., 1000.], result.number())
+
+    def test_Where_ValuesWithDifferentUnits_ReturnValuesInUnitOfFirst(self):
+        x = as_unum(m * numpy.array([1., 2., 3.]))
+
+        result = numpy.where(x > 2 * m, x, 10 * cm)
+
+        numpy.testing.assert_allclose([0.1, 0.1, 3.], result.number(m))
+
+    def test_Concatenate_IncompatibleUnits_Throws(self):
+        with self.assertRaises(unum.IncompatibleUnitsError):
+            numpy.concatenate([m * numpy.array([1., 2.]), s * numpy.array([1.])])
+
+    def test_Prod_NotSupportedFunction_Throws(self):
+        with self.assertRaises(TypeError):
+            numpy.prod(m * numpy.array([1., 2.]))
@@ -0,0 +1,111 @@
+from __future__ import unicode_literals, absolute_import
+
+import io
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+import unum
+from unum.storage import load, save
+from unum.units import *
+
+
+class StorageTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, 'values.unum')
+
+    def test_Load_SavedUnum_ReturnUnumWrappingMemmap(self):
+        save(self.path, m / s * numpy.arange(5.))
+
+        result = load(self.path)
+
+        self.assertIsInstance(result._value, numpy.memmap)
+        self.assertEqual(m / s, result.unit())
+        numpy.testing.assert_allclose([.002, .003], result[2:4].number(km / s))
+
+    def test_Load_MmapModeNone_ReturnUnumWithArrayInMemory(self):
+        save(self.path, kg * numpy.arange(6).reshape(2, 3))
+
+        result = load(self.path, mmap_mode=None)
+
+        self.assertNotIsInstance(result._value, numpy.memmap)
+        self.assertEqual((2, 3), result._value.shape)
+        self.assertEqual(kg, result.unit())
+
+    def test_Load_HeaderOfAnyLength_ReturnMemmapAlignedTo64Bytes(self):
+        for unit in m, m / s, kg * m / s ** 2, J / (kg * K * mol):
+            save(self.path, unit * numpy.arange(5.))
+
+            result = load(self.path)
+
+            self.assertEqual(0, result._value.offset % 64)
+            self.assertTrue(result._value.flags.aligned)
+
+    def test_Load_ArrayOfNpyVersion3_ReturnUnumOfArray(self):
+        self.save_with_npy(numpy.arange(5.), version=(3, 0))
+
+        numpy.testing.assert_allclose([2., 3.], load(self.path)[2:4].number(m))
+
+    def test_Load_ArrayOfUnknownNpyVersion_Throws(self):
+        self.save_with_npy(numpy.arange(5.), version=(1, 0))
+
+        with open(self.path, 'rb') as stream:
+            data = stream.read()
+
+        npy = data.index(b'\x93NUMPY')
+
+        with open(self.path, 'wb') as stream:
+            stream.write(data[:npy + 6] + b'\x09\x00' + data[npy + 8:])
+
+        for mmap_mode in 'r', None:
+            with self.assertRaises(unum.UnumError):
+                load(self.path, mmap_mode)
+
+    def test_Load_OtherFile_Throws(self):
+        with open(self.path, 'wb') as stream:
+            numpy.save(stream, numpy.arange(5.))
+
+        with self.assertRaises(unum.UnumError):
+            load(self.path)
+
+    def test_Load_UnknownUnit_Throws(self):
+        save(self.path, unum.Unum(numpy.arange(5.), {'not defined unit': 1}))
+
+        with self.assertRaises(unum.UnknownUnitError):
+            load(self.path)
+
+    def test_Pickle_MappedUnum_PickleReferenceToFile(self):
+        save(self.path, m * numpy.arange(100000.))
+        value = load(self.path)
+
+        data = pickle.dumps(value)
+        result = pickle.loads(data)
+
+        self.assertLess(len(data), 1000)
+        self.assertIsInstance(result._value, numpy.memmap)
+        self.assertEqual(value[-1], result[-1])
+
+    def test_Pickle_SliceOfMappedUnum_PickleData(self):
+        save(self.path, m * numpy.arange(10.))
+
+        result = pickle.loads(pickle.dumps(load(self.path)[5:]))
+
+        numpy.testing.assert_allclose([5., 6., 7., 8., 9.], result.number(m))
+
+    def save_with_npy(self, array, version):
+        save(self.path, m * array[:0])
+
+        with open(self.path, 'rb') as stream:
+            data = stream.read()
+
+        npy = io.BytesIO()
+        numpy.lib.format.write_array(npy, array, version=version)
+
+        with open(self.path, 'wb') as stream:
+            stream.write(data[:data.index(b'\x93NUMPY')] + npy.getvalue())
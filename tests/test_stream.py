@@ -0,0 +1,112 @@
+from __future__ import unicode_literals, absolute_import
+
+import io
+import unittest
+
+import numpy
+
+import unum
+from unum.stream import Summary, convert, feed, read, summarize
+from unum.units import *
+
+
+class StreamTest(unittest.TestCase):
+    def test_Read_Unum_YieldChunksOfGivenSize(self):
+        result = list(read(m * numpy.arange(5.), size=2))
+
+        self.assertEqual([2, 2, 1], [len(chunk) for chunk in result])
+        self.assertEqual(m, result[-1].unit())
+
+    def test_Read_BinaryFile_YieldChunksWithGivenUnit(self):
+        stream = io.BytesIO(numpy.arange(5.).tobytes())
+
+        result = list(read(stream, km, size=3))
+
+        self.assertEqual(km, result[0].unit())
+        numpy.testing.assert_allclose([3., 4.], result[1].number(km))
+
+    def test_Read_IterableOfUnums_YieldArraysInUnitOfFirst(self):
+        result = list(read(iter([1 * m, 2 * km, 3 * cm]), size=2))
+
+        numpy.testing.assert_allclose([1., 2000.], result[0].number(m))
+        numpy.testing.assert_allclose([.03], result[1].number(m))
+
+    def test_Read_IterableOfNumbersWithUnit_YieldChunksInUnit(self):
+        result = list(read([1.0, 2.0, 3.0], unit=m, size=2))
+
+        self.assertEqual(m, result[0].unit())
+        numpy.testing.assert_array_equal([3.], result[1].number(m))
+
+    def test_Read_IterableOfIntegerUnums_YieldFloatChunks(self):
+        result = list(read([1 * km, 2 * m, 3 * m], unit=m, size=2))
+
+        self.assertEqual([numpy.float64, numpy.float64], [chunk._value.dtype for chunk in result])
+        numpy.testing.assert_array_equal([1000., 2.], result[0].number(m))
+
+    def test_Read_NumbersAndUnumsWithUnit_YieldNumbersInUnitAndConvertedUnums(self):
+        result = list(read([1, 2 * m, 3.5, 4 * km], unit=km, size=4))
+
+        numpy.testing.assert_allclose([1., .002, 3.5, 4.], result[0].number(km))
+
+    def test_Read_UnumWithUnit_YieldChunksConvertedToUnit(self):
+        result = list(read(km * numpy.arange(3.), unit=m, size=2))
+
+        self.assertIs(m._unit, result[0]._unit)
+        numpy.testing.assert_allclose([0., 1000.], result[0]._value)
+
+    def test_Read_UnumWithIncompatibleUnit_Throws(self):
+        with self.assertRaises(unum.IncompatibleUnitsError):
+            read(km * numpy.arange(3.), unit=s)
+
+    def test_Read_BinaryFileEndingWithPartOfValue_Throws(self):
+        stream = io.BytesIO(numpy.arange(3.).tobytes()[:-1])
+
+        with self.assertRaises(unum.UnumError):
+            list(read(stream, m, size=2))
+
+    def test_Read_BinaryStreamReturningPartsOfValues_YieldWholeValues(self):
+        stream = _ShortReadStream(numpy.arange(3.).tobytes())
+
+        result = list(read(stream, m, size=2))
+
+        numpy.testing.assert_array_equal([0., 1., 2.], numpy.concatenate([chunk.number(m) for chunk in result]))
+
+    def test_Convert_ChunksInOtherUnit_YieldChunksInGivenUnit(self):
+        result = list(convert(read(km * numpy.arange(4.), size=2), m))
+
+        self.assertIs(m._unit, result[1]._unit)
+        numpy.testing.assert_allclose([2000., 3000.], result[1]._value)
+
+    def test_Convert_IncompatibleUnit_Throws(self):
+        with self.assertRaises(unum.IncompatibleUnitsError):
+            list(convert(read(km * numpy.arange(4.), size=2), s))
+
+    def test_Summarize_Chunks_ReturnStatisticsOfAllValues(self):
+        result = summarize(read(m * numpy.arange(10.), size=3), cm)
+
+        self.assertEqual(10, result.count)
+        self.assertEqual(4500 * cm, result.total)
+        self.assertEqual(450 * cm, result.mean)
+        self.assertEqual(900 * cm, result.maximum)
+
+    def test_Feed_Chunks_YieldChunksAndUpdateSummary(self):
+        summary = Summary()
+
+        result = list(feed(read(m * numpy.arange(4.), size=2), summary))
+
+        self.assertEqual(2, len(result))
+        self.assertEqual(0 * m, summary.minimum)
+
+
+class _ShortReadStream(io.RawIOBase):
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._data.read(min(len(buffer), 5))
+        buffer[:len(data)] = data
+
+        return len(data)
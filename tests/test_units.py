@@ -0,0 +1,111 @@
+from __future__ import unicode_literals, absolute_import
+
+import ast
+import os
+import subprocess
+import sys
+import unittest
+
+import unum
+import unum.units
+from unum.units import _index
+import unum.units.custom.mechanical
+import unum.units.others
+import unum.units.si.derived
+
+
+class LazyUnitsTest(unittest.TestCase):
+    def test_GetAttr_UnitOfSubmodule_ReturnSameUnit(self):
+        self.assertIs(unum.units.si.derived.J, unum.units.J)
+
+    def test_GetAttr_UnitRedefinedBySubmodule_ReturnUnitOfLastSubmodule(self):
+        self.assertIs(unum.units.others.H, unum.units.H)
+        self.assertIs(unum.units.si.derived.H, unum.units.si.H)
+
+    def test_GetAttr_NotDefinedName_Throws(self):
+        with self.assertRaises(AttributeError):
+            _ = unum.units.not_defined_unit
+
+    def test_StarImport_Always_ImportAllUnits(self):
+        namespace = {}
+
+        exec('from unum.units import *', namespace)
+
+        for name in ['m', 'km', 'J', 'h', 'mile', 'kNm', 'unitless']:
+            self.assertIn(name, namespace)
+
+    def test_Index_Always_ListModulesOfAllUnitsAndAttributes(self):
+        output = self.run_python('from unum.units import _loader; print(repr(_loader.build_index()))')
+
+        self.assertEqual(
+            ast.literal_eval(output),
+            {'UNITS': _index.UNITS, 'PREFIXES': _index.PREFIXES, 'EXPORTS': _index.EXPORTS},
+        )
+
+    def test_Decode_UnitOfNotImportedModule_ImportModule(self):
+        output = self.run_python('import unum.units; from unum.utils import decode; '
+                                 'print(decode([2, {"min": 1}]).cast_unit(unum.units.s))')
+
+        self.assertEqual('120.0 [s]', output)
+
+    def test_Unpickle_UnitsOfNotImportedModules_ImportModules(self):
+        data = self.run_python('import pickle; from unum.units import *; print(pickle.dumps([2 * celsius, 3 * minutes, 2 * N]).hex())')
+        output = self.run_python('import pickle, sys, unum.units; print(pickle.loads(bytes.fromhex("%s")), '
+                                 '"unum.units.custom.mechanical" in sys.modules)' % data)
+
+        self.assertEqual('[2 [deg C], 3 [min], 2 [N]] False', output)
+
+    def test_GetItem_PrefixedUnitOfNotImportedModule_ImportModules(self):
+        output = self.run_python('import unum, unum.units; print(unum.UNIT_TABLE["km"].name)')
+
+        self.assertEqual('kilometer', output)
+
+    def test_NewUnit_SymbolOfNotImportedModule_Throws(self):
+        output = self.run_python('import unum, unum.units\n'
+                                 'try:\n    unum.new_unit("min")\nexcept unum.NameConflictError:\n    print("conflict")')
+
+        self.assertEqual('conflict', output)
+
+    def test_GetItem_NotDefinedUnit_Throws(self):
+        with self.assertRaises(unum.UnknownUnitError):
+            _ = unum.UNIT_TABLE['not defined unit']
+
+    def test_Import_AccessBaseUnit_NotImportOtherModules(self):
+        output = self.run_python('import sys, unum.units; unum.units.km; print(sorted(m for m in sys.modules if "unum.units." in m))')
+
+        self.assertIn('unum.units.si.base', output)
+        self.assertNotIn('unum.units.si.derived', output)
+        self.assertNotIn('unum.units.others', output)
+
+    @staticmethod
+    def run_python(code):
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+
+        return subprocess.check_output([sys.executable, '-c', code], env=env).decode().strip()
+
+
+class ErasedUnitsTest(unittest.TestCase):
+    def test_Import_UnitsErased_UnitsAreFloatsInBasicUnits(self):
+        output = self.run_erased('from unum.units import *; print(repr((km, mg, kN, h)))')
+
+        self.assertEqual('(1000.0, 1e-06, 1000.0, 3600.0)', output)
+
+    def test_AsNumber_UnitsErased_ReturnNumberInGivenUnit(self):
+        output = self.run_erased('from unum.units import *; from unum.utils import *; print(as_number(5 * km, mm))')
+
+        self.assertEqual('5000000.0', output)
+
+    def test_AsNumber_UnitsErasedAndNumberInPrefixedUnit_ReturnSameNumberAsWithUnits(self):
+        from unum.units import km, m
+        from unum.utils import as_number
+
+        output = self.run_erased('from unum.units import *; from unum.utils import *; print(as_number(5, km, m))')
+
+        self.assertEqual(as_number(5, km, m), float(output))
+        self.assertEqual(5000.0, float(output))
+
+    @staticmethod
+    def run_erased(code):
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path), UNUM_ERASE_UNITS='1')
+
+        return subprocess.check_output([sys.executable, '-c', code], env=env).decode().strip()
@@ -187,9 +187,141 @@ class ModuleTest(unittest.TestCase):
 
         self.assertAlmostEqual(123.3, actual.number(m))
 
+    def test_Compiled_ArgumentsInOtherUnits_ReturnSameResultAsFunction(self):
+        def deflection(q, l, e, i):
+            return 5 * q * l ** 4 / (384 * e * i) + 2 * mm
+
+        function = self.compiled(deflection)
+
+        function(10 * kN / m, 6 * m, 210 * GPa, 8000 * cm ** 4)
+        actual = function(20 * N / mm, 600 * cm, 210000 * MPa, 8000 * cm ** 4)
+
+        self.assertAlmostEqual(deflection(20 * N / mm, 6 * m, 210 * GPa, 8000 * cm ** 4).number(mm), actual.number(mm))
+
+    def test_Compiled_IncompatibleUnits_Throws(self):
+        function = self.compiled(lambda a, b: a + b)
+
+        with self.assertRaises(unum.exceptions.IncompatibleUnitsError):
+            function(1 * m, 1 * s)
+
+    def test_Compiled_FunctionComparesValues_CallFunction(self):
+        function = self.compiled(lambda a: a if a > 0 * m else -a)
+
+        self.assertEqual(3 * m, function(-3 * m))
+        self.assertEqual(2 * km, function(2 * km))
+
+    def test_Compiled_NumberArguments_ReturnNumber(self):
+        function = self.compiled(lambda a: a * 2)
+
+        actual = function(3)
+
+        self.assertEqual(6, actual)
+        self.assertNotIsInstance(actual, unum.Unum)
+
+    def test_Compiled_NumberArgumentsAndUnumConstant_ReturnUnum(self):
+        function = self.compiled(lambda a: a * m)
+
+        self.assertEqual(3 * m, function(3))
+
+    def test_Compiled_NoneArgument_PassNoneToFunction(self):
+        function = self.compiled(lambda a, scale: a * 2 if scale is None else a * scale)
+
+        self.assertEqual(6 * m, function(3 * m, None))
+        self.assertEqual(9 * m, function(3 * m, 3))
+
+    def test_Compiled_StringArgument_PassStringToFunction(self):
+        function = self.compiled(lambda a, flag: a * 2 if isinstance(flag, str) else a)
+
+        self.assertEqual(6 * m, function(3 * m, 'a'))
+        self.assertEqual(3 * m, function(3 * m, 1))
+
+    def test_Compiled_NumberArgumentsOfUnum_TraceEveryValue(self):
+        function = self.compiled(lambda a, b: a * b)
+
+        function(3 * m, 2)
+
+        self.assertEqual(12 * m, function(3 * m, 4))
+
+    def test_Compiled_UnhashableArgument_CallFunction(self):
+        function = self.compiled(lambda a, b: a * b[0])
+
+        self.assertEqual(6 * m, function(3 * m, [2]))
+
+    def test_Compiled_ArrayArguments_ReturnUnumWithArray(self):
+        function = self.compiled(lambda a, b: a * b)
+
+        actual = function(m * numpy.array([1., 2.]), 2 * s)
+
+        self.assertEqual([2., 4.], list(actual.number(m * s)))
+
+    def test_Collapse_ObjectArrayOfUnums_ReturnUnumWithFloatArrayInUnitOfFirst(self):
+        array = numpy.empty(3, dtype=object)
+        array[:] = [1 * m, 2 * km, 3 * cm]
+
+        result = self.collapse(array)
+
+        self.assertIs(m._unit, result._unit)
+        self.assertEqual(numpy.float64, result._value.dtype)
+        numpy.testing.assert_allclose([1., 2000., 0.03], result._value)
+
+    def test_Collapse_UnitGiven_ReturnArrayInGivenUnit(self):
+        result = self.collapse([[1 * m, 2 * m], [3 * m, 4 * m]], km)
+
+        self.assertEqual((2, 2), result._value.shape)
+        numpy.testing.assert_allclose([0.003, 0.004], result._value[1])
+
+    def test_Collapse_IncompatibleUnits_Throws(self):
+        with self.assertRaises(unum.exceptions.IncompatibleUnitsError):
+            self.collapse([1 * m, 2 * s])
+
+    def test_AsNumbers_MixedCompatibleUnits_ReturnFloatArrayInGivenUnit(self):
+        result = self.as_numbers([1 * m, 2 * km, 3 * cm], m)
+
+        self.assertEqual(numpy.float64, result.dtype)
+        numpy.testing.assert_allclose([1., 2000., 0.03], result)
+
+    def test_AsNumbers_OutGiven_FillOutArray(self):
+        out = numpy.zeros(2)
+
+        result = self.as_numbers([1 * km, 2 * m], m, out=out)
+
+        self.assertIs(out, result)
+        numpy.testing.assert_allclose([1000., 2.], out)
+
+    def test_AsNumbers_UnitlessZero_ReturnZero(self):
+        result = self.as_numbers([0, 2 * km, 0.0, 3 * cm], m)
+
+        numpy.testing.assert_allclose([0., 2000., 0., 0.03], result)
+
+    def test_AsNumbers_ZeroOfIncompatibleUnit_ReturnZero(self):
+        result = self.as_numbers([0 * s, 2 * km, 0 * kg], m)
+
+        numpy.testing.assert_allclose([0., 2000., 0.], result)
+
+    def test_AsNumbers_ZeroAndNotZeroOfIncompatibleUnit_ThrowsWithIndexOfNotZero(self):
+        with self.assertRaises(unum.exceptions.IncompatibleElementError) as context:
+            self.as_numbers([0 * s, 1 * m, 2 * s], m)
+
+        self.assertEqual(2, context.exception.index)
+
+    def test_AsNumbers_UnitlessNotZero_Throws(self):
+        with self.assertRaises(unum.exceptions.IncompatibleElementError) as context:
+            self.as_numbers([0, 1 * m, 2], m)
+
+        self.assertEqual(2, context.exception.index)
+
+    def test_AsNumbers_IncompatibleElement_ThrowsWithItsIndex(self):
+        with self.assertRaises(unum.exceptions.IncompatibleElementError) as context:
+            self.as_numbers([1 * m, 2 * km, 3 * s, 4 * kg], m)
+
+        self.assertEqual(2, context.exception.index)
+
     uarray = staticmethod(unum.utils.uarray)
+    as_numbers = staticmethod(unum.utils.as_numbers)
+    collapse = staticmethod(unum.utils.collapse)
     as_unum = staticmethod(unum.utils.as_unum)
     as_unit = staticmethod(unum.utils.as_unit)
     as_number = staticmethod(unum.utils.as_number)
     decode = staticmethod(unum.utils.decode)
     encode = staticmethod(unum.utils.encode)
+    compiled = staticmethod(unum.utils.compiled)
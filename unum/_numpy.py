@@ -0,0 +1,431 @@
+"""Implementation of numpy protocols of Unum (NEP 13 __array_ufunc__ and NEP 18 __array_function__).
+
+Functions are computed on values of Unums, after units of arguments are checked and values are
+converted to common units when they are required, so the result wraps one typed array.
+
+This module is imported by Unum methods called by numpy, so numpy is always imported already.
+"""
+from __future__ import absolute_import, division
+
+import numbers
+
+import numpy
+
+from .core import EMPTY_SIGNATURE, Unum, _is_zero, _match, _new_unum, _split
+from .exceptions import IncompatibleUnitsError, ShouldBeUnitlessError, UnumError
+
+
+def _to_unit(value, unit):
+    """
+    Return value of Unum or unitless value expressed in UnitSignature unit.
+    """
+
+    value, source = _split(value)
+
+    if source is unit:
+        return value
+
+    factor = source.conversion_factor(unit)
+
+    if factor is None:
+        if _is_zero(value):
+            return value
+
+        raise IncompatibleUnitsError(_new_unum(value, source), _new_unum(1, unit))
+
+    return value if factor == 1 else value * factor
+
+
+def _unitless(value):
+    """
+    Return value of Unum or unitless value converted to a number without unit (e.g. rad to 1).
+    """
+
+    value, unit = _split(value)
+
+    if not unit:
+        return value
+
+    factor = unit.conversion_factor(EMPTY_SIGNATURE)
+
+    if factor is None:
+        raise ShouldBeUnitlessError(_new_unum(value, unit))
+
+    return value if factor == 1 else value * factor
+
+
+def _common(values):
+    """
+    Return (values, unit) where values are expressed in the unit of the first Unum.
+    """
+
+    unit = next((value._unit for value in values if isinstance(value, Unum)), EMPTY_SIGNATURE)
+
+    return [_to_unit(value, unit) for value in values], unit
+
+
+def _exponent(value):
+    exponent = _unitless(value)
+
+    if numpy.ndim(exponent) != 0:
+        raise UnumError("exponent of a value with unit must be a scalar, got %s" % (exponent,))
+
+    return exponent.item() if isinstance(exponent, numpy.generic) else exponent
+
+
+def _wrap(value, unit):
+    """
+    Return Unum of value and UnitSignature unit, or value if unit is None.
+    """
+
+    return value if unit is None else _new_unum(value, unit)
+
+
+# ufunc rules get values of inputs and return (values, units of outputs), None unit is a plain result
+
+def _same_unit(inputs):
+    values, unit = _matched(inputs)
+    return values, (unit,)
+
+
+def _comparison(inputs):
+    values, _ = _matched(inputs)
+    return values, (None,)
+
+
+def _equality(inputs):
+    try:
+        return _comparison(inputs)
+    except IncompatibleUnitsError:
+        # like Unum.__eq__, values with incompatible units differ, arrays of False and True keep shapes
+        s_value, o_value = _split(inputs[0])[0], _split(inputs[1])[0]
+        return [numpy.zeros(numpy.shape(s_value), bool), numpy.ones(numpy.shape(o_value), bool)], (None,)
+
+
+def _matched(inputs):
+    s_value, s_unit = _split(inputs[0])
+    o_value, o_unit = _split(inputs[1])
+    s_value, o_value, unit = _match(s_value, s_unit, o_value, o_unit)
+
+    return [s_value, o_value], unit
+
+
+def _first_unit(inputs):
+    value, unit = _split(inputs[0])
+    return [value] + [_split(other)[0] for other in inputs[1:]], (unit,)
+
+
+def _unit_independent(inputs):
+    return [_split(value)[0] for value in inputs], (None,)
+
+
+def _dimensionless(inputs):
+    return [_unitless(value) for value in inputs], (None,)
+
+
+def _product(inputs):
+    (s_value, s_unit), (o_value, o_unit) = _split(inputs[0]), _split(inputs[1])
+    return [s_value, o_value], (s_unit * o_unit,)
+
+
+def _quotient(inputs):
+    (s_value, s_unit), (o_value, o_unit) = _split(inputs[0]), _split(inputs[1])
+    return [s_value, o_value], (s_unit / o_unit,)
+
+
+def _power(inputs):
+    value, unit = _split(inputs[0])
+
+    if not unit:
+        return [value, _unitless(inputs[1])], (EMPTY_SIGNATURE,)
+
+    exponent = _exponent(inputs[1])
+
+    return [value, exponent], (unit ** exponent if exponent else EMPTY_SIGNATURE,)
+
+
+def _root(exponent):
+    def rule(inputs):
+        value, unit = _split(inputs[0])
+        return [value], (unit ** exponent,)
+
+    return rule
+
+
+def _divmod(inputs):
+    values, unit = _matched(inputs)
+    return values, (EMPTY_SIGNATURE, unit)
+
+
+def _modf(inputs):
+    value, unit = _split(inputs[0])
+    return [value], (unit, unit)
+
+
+_UFUNC_RULES = {}
+
+for _names, _rule in [
+    ('add subtract maximum minimum fmax fmin remainder fmod hypot nextafter', _same_unit),
+    ('equal not_equal', _equality),
+    ('less less_equal greater greater_equal arctan2', _comparison),
+    ('negative positive absolute fabs rint floor ceil trunc conjugate spacing copysign', _first_unit),
+    ('sign signbit isnan isinf isfinite', _unit_independent),
+    ('exp exp2 expm1 log log2 log10 log1p logaddexp logaddexp2 sin cos tan arcsin arccos arctan sinh cosh tanh '
+     'arcsinh arccosh arctanh deg2rad rad2deg radians degrees', _dimensionless),
+    ('multiply matmul', _product),
+    ('divide true_divide floor_divide', _quotient),
+    ('power float_power', _power),
+    ('divmod', _divmod),
+    ('modf', _modf),
+]:
+    for _name in _names.split():
+        if hasattr(numpy, _name):  # some ufuncs aren't defined in every numpy version
+            _UFUNC_RULES[getattr(numpy, _name)] = _rule
+
+_UFUNC_RULES.update({numpy.sqrt: _root(0.5), numpy.cbrt: _root(1 / 3), numpy.square: _root(2),
+                     numpy.reciprocal: _root(-1)})
+
+del _names, _rule, _name
+
+# ufuncs which reduction keeps the unit of the operand
+_UNIT_REDUCTIONS = frozenset(function for function, rule in _UFUNC_RULES.items() if rule is _same_unit)
+
+
+def array_ufunc(ufunc, method, inputs, kwargs):
+    """
+    Implementation of Unum.__array_ufunc__.
+    """
+
+    rule = _UFUNC_RULES.get(ufunc)
+
+    if rule is None:
+        return NotImplemented
+
+    if method in ('__call__', 'outer'):
+        values, units = rule(inputs)
+    elif method in ('reduce', 'accumulate', 'reduceat'):
+        values, units = _reduction(ufunc, method, inputs, kwargs)
+    else:
+        return NotImplemented
+
+    out = kwargs.get('out')
+
+    if out is not None:
+        kwargs = dict(kwargs, out=tuple(_split(value)[0] for value in out))
+
+    result = getattr(ufunc, method)(*values, **kwargs)
+
+    if ufunc.nout == 1:
+        return _output(result, units[0], out and out[0])
+
+    return tuple(_output(value, unit, out and out[index]) for index, (value, unit) in enumerate(zip(result, units)))
+
+
+def _reduction(ufunc, method, inputs, kwargs):
+    value, unit = _split(inputs[0])
+    values = [value] + list(inputs[1:])  # reduceat indices
+
+    if not unit or ufunc in _UNIT_REDUCTIONS:
+        return values, (unit,)
+
+    if ufunc is numpy.multiply and method == 'reduce' and 'where' not in kwargs:
+        return values, (unit ** _reduced_size(numpy.shape(value), kwargs.get('axis', 0)),)
+
+    raise UnumError("%s.%s is not supported for values with unit" % (ufunc.__name__, method))
+
+
+def _reduced_size(shape, axis):
+    if axis is None:
+        axis = tuple(range(len(shape)))
+    elif isinstance(axis, numbers.Integral):
+        axis = (axis,)
+
+    size = 1
+    for index in axis:
+        size *= shape[index]
+
+    return size
+
+
+def _output(value, unit, out):
+    if isinstance(out, Unum):
+        out._value, out._unit, out._normal = value, EMPTY_SIGNATURE if unit is None else unit, False
+        return out
+
+    return _wrap(value, unit)
+
+
+# numpy functions, handlers get (function, args, kwargs) and return the result
+
+_FUNCTIONS = {}
+
+
+def _implements(names):
+    def decorator(handler):
+        for name in names.split():
+            function = numpy
+
+            for attribute in name.split('.'):
+                function = getattr(function, attribute, None)
+
+            if function is not None:  # some functions aren't defined in every numpy version
+                _FUNCTIONS[function] = handler
+
+        return handler
+
+    return decorator
+
+
+def _plain(values):
+    return [_unitless(value) for value in values]
+
+
+def _plain_kwargs(kwargs):
+    return {key: _unitless(value) for key, value in kwargs.items()}
+
+
+@_implements(
+    'sum nansum mean nanmean median nanmedian amax amin max min nanmax nanmin ptp std nanstd average cumsum '
+    'nancumsum percentile nanpercentile quantile nanquantile sort partition round around diff copy reshape ravel '
+    'transpose squeeze expand_dims moveaxis swapaxes flip fliplr flipud rot90 roll repeat tile resize '
+    'broadcast_to atleast_1d atleast_2d atleast_3d take compress delete diagonal trace triu tril real imag '
+    'zeros_like empty_like linalg.norm'
+)
+def _keep_unit(function, args, kwargs):
+    value, unit = _split(args[0])
+    result = function(value, *_plain(args[1:]), **_plain_kwargs(kwargs))
+
+    if isinstance(result, (tuple, list)):  # e.g. atleast_1d of many arrays
+        return type(result)(_new_unum(item, unit) for item in result)
+
+    return _new_unum(result, unit)
+
+
+@_implements('var nanvar')
+def _square_unit(function, args, kwargs):
+    value, unit = _split(args[0])
+    return _new_unum(function(value, *_plain(args[1:]), **_plain_kwargs(kwargs)), unit ** 2)
+
+
+@_implements(
+    'shape ndim size argmax argmin nanargmax nanargmin argsort argpartition argwhere nonzero flatnonzero '
+    'count_nonzero iscomplexobj isrealobj'
+)
+def _ignore_unit(function, args, kwargs):
+    return function(_split(args[0])[0], *_plain(args[1:]), **_plain_kwargs(kwargs))
+
+
+@_implements('concatenate stack vstack hstack dstack column_stack row_stack')
+def _join(function, args, kwargs):
+    values, unit = _common(list(args[0]))
+    return _new_unum(function(values, *_plain(args[1:]), **_plain_kwargs(kwargs)), unit)
+
+
+@_implements('append')
+def _append(function, args, kwargs):
+    values, unit = _common(list(args[:2]))
+    return _new_unum(function(*(values + _plain(args[2:])), **_plain_kwargs(kwargs)), unit)
+
+
+@_implements('where')
+def _where(function, args, kwargs):
+    if len(args) == 1:
+        return function(_unitless(args[0]))
+
+    values, unit = _common(list(args[1:]))
+    return _new_unum(function(_unitless(args[0]), *values), unit)
+
+
+@_implements('clip')
+def _clip(function, args, kwargs):
+    value, unit = _split(args[0])
+    bounds = [None if bound is None else _to_unit(bound, unit) for bound in args[1:]]
+    kwargs = {key: _to_unit(bound, unit) if key in ('a_min', 'a_max', 'min', 'max') and bound is not None
+              else bound for key, bound in kwargs.items()}
+
+    return _new_unum(function(value, *bounds, **kwargs), unit)
+
+
+@_implements('isclose allclose array_equal array_equiv searchsorted')
+def _compare(function, args, kwargs):
+    values, unit = _common(list(args[:2]))
+    kwargs = {key: _to_unit(value, unit) if key == 'atol' else _unitless(value) for key, value in kwargs.items()}
+
+    return function(*(values + _plain(args[2:])), **kwargs)
+
+
+@_implements('dot vdot inner outer tensordot kron cross')
+def _multiply(function, args, kwargs):
+    (s_value, s_unit), (o_value, o_unit) = _split(args[0]), _split(args[1])
+    return _new_unum(function(s_value, o_value, *_plain(args[2:]), **_plain_kwargs(kwargs)), s_unit * o_unit)
+
+
+@_implements('trapz trapezoid')
+def _integrate(function, args, kwargs):
+    arguments = dict(zip(('y', 'x', 'dx', 'axis'), args), **kwargs)
+    y, unit = _split(arguments.pop('y'))
+
+    x = arguments.get('x')
+    step = arguments['x'] if x is not None else arguments.get('dx', 1)
+    step_unit = _split(step)[1]
+
+    arguments = {key: _split(value)[0] for key, value in arguments.items()}
+
+    return _new_unum(function(y, **arguments), unit * step_unit)
+
+
+@_implements('interp')
+def _interpolate(function, args, kwargs):
+    arguments = dict(zip(('x', 'xp', 'fp', 'left', 'right', 'period'), args), **kwargs)
+    xp, x_unit = _split(arguments['xp'])
+    fp, unit = _split(arguments['fp'])
+
+    arguments.update(x=_to_unit(arguments['x'], x_unit), xp=xp, fp=fp)
+
+    for key in ('left', 'right'):
+        if arguments.get(key) is not None:
+            arguments[key] = _to_unit(arguments[key], unit)
+
+    if arguments.get('period') is not None:
+        arguments['period'] = _to_unit(arguments['period'], x_unit)
+
+    return _new_unum(function(**arguments), unit)
+
+
+@_implements('linspace')
+def _linspace(function, args, kwargs):
+    arguments = dict(zip(('start', 'stop', 'num', 'endpoint', 'retstep', 'dtype', 'axis'), args), **kwargs)
+    (start, stop), unit = _common([arguments['start'], arguments['stop']])
+
+    arguments.update(start=start, stop=stop)
+    result = function(**arguments)
+
+    if arguments.get('retstep'):
+        return _new_unum(result[0], unit), _new_unum(result[1], unit)
+
+    return _new_unum(result, unit)
+
+
+@_implements('full_like')
+def _full_like(function, args, kwargs):
+    value, unit = _split(args[0])
+
+    if len(args) > 1:
+        args = (value, _to_unit(args[1], unit)) + tuple(args[2:])
+    else:
+        args, kwargs = (value,), dict(kwargs, fill_value=_to_unit(kwargs['fill_value'], unit))
+
+    return _new_unum(function(*args, **kwargs), unit)
+
+
+def array_function(function, types, args, kwargs):
+    """
+    Implementation of Unum.__array_function__.
+    """
+
+    handler = _FUNCTIONS.get(function)
+
+    if handler is None or not all(issubclass(kind, (Unum, numpy.ndarray)) for kind in types):
+        return NotImplemented
+
+    return handler(function, args, kwargs)
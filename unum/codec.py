@@ -0,0 +1,278 @@
+"""Compact binary encoding of Unums.
+
+Values are written as packed little-endian numbers or raw buffers of numpy arrays, and units are
+written once per stream, then referred to by their index:
+
+    >>> data = dumps([2 * m, 3.5 * m / s, 4 * m])
+    >>> loads(data)
+    [2 [m], 3.5 [m/s], 4 [m]]
+
+Supported values are ints (which fit in 64 bits), floats and numpy arrays (including structured ones,
+but not containing objects), with or without units. Decoded values are equal to the encoded ones and have the same types, except numpy
+scalars which are decoded as Python numbers.
+"""
+from __future__ import division
+
+import array
+import ast
+import io
+import json
+import struct
+import sys
+
+import six
+
+from .core import Unum, _new_unum, _registered_signature
+from .exceptions import UnumError
+
+# record tags
+_UNIT = b'U'  # definition of unit: index, length of JSON, JSON list of [symbol, exponent]
+_FLOAT = b'd'  # unit index, float64
+_INT = b'q'  # unit index, int64
+_ARRAY = b'a'  # unit index, length of dtype, dtype as in .npy format, number of dimensions, shape, data in C order
+_FLOATS = b'D'  # count, unit indexes, float64 values
+_INTS = b'Q'  # count, unit indexes, int64 values
+_LIST = b'L'  # count, records of values
+
+# index of values without unit, units have next indexes
+_NO_UNIT = 0
+
+_HEADER = struct.Struct('<cH')
+_UNIT_HEADER = struct.Struct('<cHH')
+_FLOAT_RECORD = struct.Struct('<cHd')
+_INT_RECORD = struct.Struct('<cHq')
+_COUNT = struct.Struct('<cI')
+_INDEX = struct.Struct('<H')
+_LENGTH = struct.Struct('<B')
+_DESCR_LENGTH = struct.Struct('<H')
+
+_INT_RANGE = -2 ** 63, 2 ** 63 - 1
+
+
+def _packed(typecode, values):
+    values = array.array(typecode, values)
+
+    if sys.byteorder != 'little':
+        values.byteswap()
+
+    return values.tobytes() if hasattr(values, 'tobytes') else values.tostring()
+
+
+def _unpacked(typecode, data):
+    values = array.array(typecode)
+
+    if hasattr(values, 'frombytes'):
+        values.frombytes(data)
+    else:
+        values.fromstring(data)
+
+    if sys.byteorder != 'little':
+        values.byteswap()
+
+    return values
+
+
+class Encoder(object):
+    """
+    Writes values to binary stream, each unit is defined once in the stream.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._indexes = {}  # {UnitSignature: index}
+
+    def _index(self, unit):
+        try:
+            return self._indexes[unit]
+        except KeyError:
+            pass
+
+        index = len(self._indexes) + 1
+
+        if index > 0xFFFF:
+            raise UnumError("too many units in one stream")
+
+        definition = json.dumps(sorted(unit.items()), separators=(',', ':')).encode('utf-8')
+        self._stream.write(_UNIT_HEADER.pack(_UNIT, index, len(definition)) + definition)
+        self._indexes[unit] = index
+
+        return index
+
+    def write(self, value):
+        """
+        Write Unum or unitless value.
+        """
+
+        if isinstance(value, Unum):
+            number, index = value._value, self._index(value._unit)
+        else:
+            number, index = value, _NO_UNIT
+
+        if hasattr(number, 'dtype') and not getattr(number, 'shape', ()):  # numpy scalar
+            number = number.item()
+
+        if isinstance(number, float):
+            self._stream.write(_FLOAT_RECORD.pack(_FLOAT, index, number))
+        elif isinstance(number, six.integer_types) and not isinstance(number, bool) and \
+                _INT_RANGE[0] <= number <= _INT_RANGE[1]:
+            self._stream.write(_INT_RECORD.pack(_INT, index, number))
+        elif hasattr(number, 'dtype') and hasattr(number, 'shape') and not number.dtype.hasobject:
+            self._write_array(index, number)
+        else:
+            raise TypeError("%r can't be encoded" % (number,))
+
+    def _write_array(self, index, number):
+        from numpy.lib.format import dtype_to_descr
+
+        dtype = number.dtype.newbyteorder('<')  # also fields of structured dtype
+        descr = repr(dtype_to_descr(dtype)).encode('utf-8')
+
+        self._stream.write(_HEADER.pack(_ARRAY, index) + _DESCR_LENGTH.pack(len(descr)) + descr +
+                           _LENGTH.pack(len(number.shape)) + _packed('Q', number.shape))
+        self._stream.write(number.astype(dtype, copy=False).tobytes())
+
+    def write_many(self, values):
+        """
+        Write sequence of values as one record, which is decoded as a list.
+
+        Scalars of one type are written as packed arrays of unit indexes and numbers.
+        """
+
+        values = list(values)
+        indexes, numbers = [], []
+
+        for value in values:
+            if isinstance(value, Unum):
+                indexes.append(self._index(value._unit))
+                numbers.append(value._value)
+            else:
+                indexes.append(_NO_UNIT)
+                numbers.append(value)
+
+        types = set(map(type, numbers))
+
+        if types == {float}:
+            self._stream.write(_COUNT.pack(_FLOATS, len(values)) + _packed('H', indexes) + _packed('d', numbers))
+        elif types == {int} and _INT_RANGE[0] <= min(numbers) and max(numbers) <= _INT_RANGE[1]:
+            self._stream.write(_COUNT.pack(_INTS, len(values)) + _packed('H', indexes) + _packed('q', numbers))
+        else:
+            self._stream.write(_COUNT.pack(_LIST, len(values)))
+
+            for value in values:
+                self.write(value)
+
+
+class Decoder(object):
+    """
+    Reads values written by Encoder from binary stream.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._units = [None]  # [UnitSignature] by index
+
+    def _read(self, size):
+        data = self._stream.read(size)
+
+        if len(data) != size:
+            raise UnumError("unexpected end of stream")
+
+        return data
+
+    def read(self):
+        """
+        Return the next value (or list of values written by write_many).
+
+        :raises EOFError: at the end of stream
+        :raises UnknownUnitError: if a unit of stream isn't defined (modules of units are loaded, see unum.units)
+        """
+
+        tag = self._stream.read(1)
+
+        while tag == _UNIT:
+            index, length = struct.unpack('<HH', self._read(4))
+            unit = json.loads(self._read(length).decode('utf-8'))
+            self._units[index:] = [_registered_signature(*[item for pair in unit for item in pair])]
+            tag = self._stream.read(1)
+
+        if not tag:
+            raise EOFError("end of stream")
+
+        if tag == _FLOAT:
+            index, number = struct.unpack('<Hd', self._read(10))
+        elif tag == _INT:
+            index, number = struct.unpack('<Hq', self._read(10))
+        elif tag == _ARRAY:
+            index, number = self._read_array()
+        elif tag in (_FLOATS, _INTS):
+            return self._read_numbers('d' if tag == _FLOATS else 'q')
+        elif tag == _LIST:
+            count, = struct.unpack('<I', self._read(4))
+            return [self.read() for _ in range(count)]
+        else:
+            raise UnumError("unknown record %r" % tag)
+
+        return self._value(number, index)
+
+    def _value(self, number, index):
+        return number if index == _NO_UNIT else _new_unum(number, self._units[index])
+
+    def _read_array(self):
+        import numpy
+        from numpy.lib.format import descr_to_dtype
+
+        index, = _INDEX.unpack(self._read(2))
+        descr = self._read(_DESCR_LENGTH.unpack(self._read(2))[0]).decode('utf-8')
+        ndim, = _LENGTH.unpack(self._read(1))
+        shape = tuple(_unpacked('Q', self._read(8 * ndim)))
+
+        try:
+            dtype = descr_to_dtype(ast.literal_eval(descr))
+        except (ValueError, TypeError, SyntaxError):
+            raise UnumError("invalid dtype %r" % descr)
+
+        if dtype.hasobject:
+            raise UnumError("array of objects can't be decoded")
+
+        size = dtype.itemsize
+        for length in shape:
+            size *= length
+
+        number = numpy.frombuffer(bytearray(self._read(size)), dtype).reshape(shape)
+
+        return index, number.astype(dtype.newbyteorder('='), copy=False)
+
+    def _read_numbers(self, typecode):
+        count, = struct.unpack('<I', self._read(4))
+        indexes = _unpacked('H', self._read(2 * count))
+        numbers = _unpacked(typecode, self._read(8 * count))
+        units = self._units
+
+        return [number if index == _NO_UNIT else _new_unum(number, units[index])
+                for index, number in zip(indexes, numbers)]
+
+    def __iter__(self):
+        while True:
+            try:
+                yield self.read()
+            except EOFError:
+                return
+
+
+def dumps(values):
+    """
+    Return bytes of sequence of values, see Encoder.write_many.
+    """
+
+    stream = io.BytesIO()
+    Encoder(stream).write_many(values)
+
+    return stream.getvalue()
+
+
+def loads(data):
+    """
+    Return list of values encoded by dumps.
+    """
+
+    return Decoder(io.BytesIO(data)).read()
@@ -1,23 +1,395 @@
 from __future__ import division, unicode_literals
 
 import collections
+import numbers
+import os
+import sys
+import weakref
+from fractions import Fraction
 
 import six
+from six.moves import collections_abc
 
 from .exceptions import *
 
 BASIC_UNIT = 0
 
-UnitDefinition = collections.namedtuple('UnitDefinition', ['definition', 'level', 'name'])
+UnitDefinition = collections.namedtuple('UnitDefinition', ['definition', 'level', 'name', 'expansion', 'prefixable'])
+
+Prefix = collections.namedtuple('Prefix', ['value', 'factor', 'kind', 'name'])
+
+Expansion = collections.namedtuple('Expansion', ['factor', 'unit', 'kind'])
+
+# kinds of numbers met in an expansion, the widest one decides the type of a conversion factor
+_INTEGRAL, _RATIONAL, _REAL = range(3)
+
+
+def _exact(value):
+    """
+    Return (value, kind) where value is converted to exact Fraction if possible.
+
+    Floats are kept exactly as they are represented, so rounding is done once,
+    when the conversion factor is finally computed.
+    """
+
+    if isinstance(value, six.integer_types):
+        return Fraction(value), _INTEGRAL
+
+    if isinstance(value, Fraction):
+        return value, _RATIONAL
+
+    try:
+        return Fraction(value), _REAL
+    except (TypeError, ValueError, OverflowError):
+        return value, _REAL
+
+
+def _ratio(source, target):
+    """
+    Return the factor converting a value expressed by source expansion to target expansion.
+
+    The factor has type which the same calculation made on original numbers would have.
+    """
+
+    ratio = source.factor / target.factor
+    kind = max(source.kind, target.kind)
+
+    if not isinstance(ratio, Fraction) or kind == _RATIONAL:
+        return ratio
+
+    if kind == _INTEGRAL and ratio.denominator == 1:
+        return ratio.numerator
+
+    return float(ratio)
+
+
+_UNITLESS_EXPANSION = Expansion(1, {}, _INTEGRAL)
+
+
+def _substituted(unit, symbol, definition, exponent):
+    """
+    Return copy of unit where symbol to the power of exponent is replaced by its definition unit.
+    """
+
+    result = dict(unit)
+
+    for u, exp in definition.items():
+        exp = exp * exponent + result.get(u, 0)
+
+        if exp:
+            result[u] = exp
+        else:
+            del result[u]
+
+    del result[symbol]
+
+    return result
+
+
+# maximum number of entries in each result cache of UnitSignature
+SIGNATURE_CACHE_SIZE = 64
+
+
+def _store(cache, key, value):
+    """
+    Store value in LRU dict cache of UnitSignature, evicting the least recently used entry if it's full.
+
+    Entries are ordered from the least recently used, a hit moves its entry to the end.
+    """
+
+    if len(cache) >= SIGNATURE_CACHE_SIZE:
+        del cache[next(iter(cache))]
+
+    cache[key] = value
+
+    return value
+
+
+class UnitSignature(collections_abc.Mapping):
+    """
+    Immutable {unit symbol : exponent} mapping.
+
+    Signatures are interned: there is one instance per distinct mapping, so equal
+    signatures can be compared by identity. Integral float exponents are stored as int.
+    Results of operations are cached per instance, up to SIGNATURE_CACHE_SIZE recently used ones.
+    """
+
+    __slots__ = (
+        '_dict', 'sorted_items', '_max_level', '_products', '_quotients', '_powers', '_conversions',
+        '__weakref__',
+    )
+
+    _interned = weakref.WeakValueDictionary()
+
+    def __new__(cls, unit=None):
+        if isinstance(unit, UnitSignature):
+            return unit
+
+        unit = {} if unit is None else dict(unit)
+        key = frozenset(unit.items())
+
+        try:
+            return cls._interned[key]
+        except KeyError:
+            pass
+
+        self = super(UnitSignature, cls).__new__(cls)
+        self._dict = {
+            symbol: int(exp) if isinstance(exp, float) and exp.is_integer() else exp for symbol, exp in unit.items()
+        }
+        self.sorted_items = tuple(sorted(self._dict.items()))
+        self._max_level = None
+        self._products = {}  # {id(other): (other, self * other)}, other is kept alive so the id is not reused
+        self._quotients = {}  # {id(other): (other, self / other)}
+        self._powers = {}  # {exponent: self ** exponent}
+        self._conversions = {}  # {id(target): (target, table version, factor or None)}
+
+        return cls._interned.setdefault(key, self)
+
+    def __getitem__(self, symbol):
+        return self._dict[symbol]
+
+    def __contains__(self, symbol):
+        return symbol in self._dict
+
+    def __iter__(self):
+        return iter(self._dict)
+
+    def __len__(self):
+        return len(self._dict)
+
+    def items(self):
+        return self._dict.items()
+
+    __hash__ = object.__hash__  # equal signatures are the same object
+
+    def __eq__(self, other):
+        if isinstance(other, UnitSignature):
+            return self is other
+
+        return isinstance(other, collections_abc.Mapping) and self._dict == dict(other.items())
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __mul__(self, other):
+        key = id(other)
+
+        try:
+            entry = self._products[key] = self._products.pop(key)
+            return entry[1]
+        except KeyError:
+            pass
+
+        if not self._dict:
+            result = other
+        elif not other._dict:
+            result = self
+        else:
+            unit = self._dict.copy()
+            for u, exp in other._dict.items():
+                exp += unit.get(u, 0)
+                if exp:
+                    unit[u] = exp
+                else:
+                    del unit[u]
+
+            result = UnitSignature(unit)
+
+        return _store(self._products, key, (other, result))[1]
+
+    def __div__(self, other):
+        key = id(other)
+
+        try:
+            entry = self._quotients[key] = self._quotients.pop(key)
+            return entry[1]
+        except KeyError:
+            pass
+
+        if not other._dict:
+            result = self
+        else:
+            unit = self._dict.copy()
+            for u, exp in other._dict.items():
+                exp -= unit.get(u, 0)
+                if exp:
+                    unit[u] = -exp
+                else:
+                    del unit[u]
+
+            result = UnitSignature(unit)
+
+        return _store(self._quotients, key, (other, result))[1]
+
+    __truediv__ = __div__  # Python 3.0 compatibility.
+
+    def __pow__(self, exponent):
+        try:
+            result = self._powers[exponent] = self._powers.pop(exponent)
+            return result
+        except KeyError:
+            return _store(self._powers, exponent, UnitSignature({u: exp * exponent for u, exp in self._dict.items()}))
+
+    def max_level(self):
+        """
+        :return: the maximum level of the units, cached until UNIT_TABLE changes
+        """
+
+        if self._max_level is None or self._max_level[0] != UNIT_TABLE.version:
+            self._max_level = UNIT_TABLE.version, max([0] + [UNIT_TABLE[symbol].level for symbol in self._dict])
+
+        return self._max_level[1]
+
+    def conversion_factor(self, target):
+        """
+        Return the factor converting a value in this unit to target unit, or None if units are incompatible.
+
+        Both factors and incompatibility are cached until UNIT_TABLE changes.
+        """
+
+        entry = self._conversions.pop(id(target), None)
+
+        if entry is not None and entry[1] == UNIT_TABLE.version:
+            self._conversions[id(target)] = entry
+            return entry[2]
+
+        source_expansion, target_expansion = UNIT_TABLE.expand(self), UNIT_TABLE.expand(target)
+
+        if source_expansion.unit == target_expansion.unit:
+            factor = _ratio(source_expansion, target_expansion)
+        else:
+            factor = None
+
+        return _store(self._conversions, id(target), (target, UNIT_TABLE.version, factor))[2]
+
+    def __reduce__(self):
+        # pickle memoizes the signature, so Unums of one unit refer to it in the stream
+        return _registered_signature, tuple(item for pair in self.sorted_items for item in pair)
+
+    # signatures are interned and immutable, so copies are the signature itself (also of not defined units)
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return 'UnitSignature(%r)' % (self._dict,)
+
+
+EMPTY_SIGNATURE = UnitSignature()
+
+
+def _registered_signature(*items):
+    """
+    Return UnitSignature of unpickled symbol, exponent, symbol, exponent... items.
+
+    Modules of symbols not defined yet are loaded, see unum.units.
+
+    :raises UnknownUnitError: if a symbol isn't defined
+    """
+
+    unit = dict(zip(items[::2], items[1::2]))
+
+    if any(symbol not in UNIT_TABLE for symbol in unit):
+        import unum.units  # sets the loader of unit table
+
+        for symbol in unit:
+            UNIT_TABLE[symbol]  # loads the module defining symbol
+
+    return UnitSignature(unit)
 
 
 class UnitTable(dict):
+    """
+    {unit symbol : UnitDefinition}
+
+    Units registered as prefixable can be used with any prefix of the table. Prefixed
+    symbols are not stored until they are looked up for the first time.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(UnitTable, self).__init__(*args, **kwargs)
+        self.version = 0
+        self.prefixes = {}
+        self._prefix_lengths = []  # the longest first
+        self.erased = False  # see erase_units
+        self.loader = None  # function importing definition of unit symbol, returns True if it did it
+
+    def __missing__(self, symbol):
+        resolved = self.resolve_prefix(symbol)
+
+        if resolved is None:
+            if self.loader is not None and self.loader(symbol):
+                return self[symbol]
+
+            raise UnknownUnitError(symbol)
+
+        prefix, base = resolved
+        base_definition = dict.__getitem__(self, base)
+        expansion = base_definition.expansion
+
+        definition = UnitDefinition(
+            Unum(prefix.value, {base: 1}, normal=True),
+            base_definition.level + 1,
+            prefix.name + base_definition.name,
+            Expansion(expansion.factor * prefix.factor, expansion.unit, max(expansion.kind, prefix.kind)),
+            False,
+        )
+
+        dict.__setitem__(self, symbol, definition)
+
+        return definition
+
+    def __contains__(self, symbol):
+        return dict.__contains__(self, symbol) or self.resolve_prefix(symbol) is not None
+
+    def resolve_prefix(self, symbol):
+        """
+        :return: (Prefix, base unit symbol) if symbol is a prefixed unit not stored in table yet, otherwise None
+        """
+
+        for length in self._prefix_lengths:
+            prefix = self.prefixes.get(symbol[:length])
+
+            if prefix is not None:
+                base = dict.get(self, symbol[length:])
+
+                if base is not None and base.prefixable:
+                    return prefix, symbol[length:]
+
+        return None
+
     def reset(self, table=None):
+        """
+        Remove all units and prefixes, then add units of table, and its prefixes if it's a UnitTable.
+
+        A table saved by copy is restored with its prefixes.
+        """
+
         self.clear()
+        self.prefixes, self._prefix_lengths = {}, []
 
         if table is not None:
             self.update(table)
 
+            if isinstance(table, UnitTable):
+                self.prefixes, self._prefix_lengths = dict(table.prefixes), list(table._prefix_lengths)
+
+        self.version += 1
+
+    def copy(self):
+        """
+        Return UnitTable with the same units and prefixes.
+        """
+
+        result = UnitTable()
+        result.reset(self)
+        result.erased = self.erased
+
+        return result
+
     def get_definition(self, symbol):
         return self[symbol].definition
 
@@ -27,26 +399,191 @@ class UnitTable(dict):
     def is_derived(self, symbol):
         return not self.is_basic(symbol)
 
-    def new_unit(self, symbol, definition=BASIC_UNIT, name=''):
+    def get_expansion(self, symbol):
+        return self[symbol].expansion
+
+    def expand(self, unit, factor=1):
+        """
+        Return Expansion of factor [unit] to basic units.
+
+        Runs in time linear in the number of symbols, because every entry keeps
+        its expansion flattened to basic units since registration.
+
+        :param dict unit: {unit symbol : exponent}
+        :param factor: value of unit
+        """
+
+        factor, kind = _exact(factor)
+        basic = {}
+
+        for symbol, exponent in unit.items():
+            expansion = self[symbol].expansion
+
+            if expansion.factor != 1:
+                factor *= expansion.factor ** exponent
+
+            kind = max(kind, expansion.kind)
+
+            for basic_symbol, basic_exponent in expansion.unit.items():
+                basic_exponent = basic.get(basic_symbol, 0) + basic_exponent * exponent
+
+                if basic_exponent:
+                    basic[basic_symbol] = basic_exponent
+                else:
+                    del basic[basic_symbol]
+
+        return Expansion(factor, basic, kind)
+
+    def new_prefix(self, symbol, base, exponent=1, name=''):
+        """
+        Define prefix multiplying prefixable units by base ** exponent, e.g. new_prefix('k', 10, 3, 'kilo').
+        """
+
+        if symbol in self.prefixes:
+            raise NameConflictError(symbol)
+
+        value = base ** exponent
+        factor = Fraction(base) ** exponent
+
+        self.prefixes[symbol] = Prefix(value, factor, _exact(value)[1], name)
+        self._prefix_lengths = sorted({len(prefix) for prefix in self.prefixes}, reverse=True)
+        self.version += 1
+
+    def get_unit(self, symbol):
+        """
+        Return Unum of already defined (or prefixed) unit.
+        """
+
+        if symbol not in self:
+            raise UnknownUnitError(symbol)
+
+        if self.erased:
+            return float(self[symbol].expansion.factor)
+
+        return Unum(1, {symbol: 1}, normal=True)
+
+    def new_unit(self, symbol, definition=BASIC_UNIT, name='', prefixable=False):
+        """
+        Define new unit and return it.
+
+        :param symbol: unit symbol
+        :param definition: Unum equal to one new unit, or 0 to define a basic unit
+        :param name: full name of unit
+        :param prefixable: if True, unit is available with all prefixes of the table
+        :raises NameConflictError: if symbol is defined, also by a unit module not imported yet
+        """
+
+        if self.loader is not None and symbol not in self:
+            self.loader(symbol)  # the module defining symbol is imported now, not on later access
+
         if symbol in self:
             raise NameConflictError(symbol)
 
+        if self.erased:
+            return self._new_erased_unit(symbol, definition, name, prefixable)
+
         if definition == BASIC_UNIT:
             equivalent = None
             level = 0
+            expansion = Expansion(1, {symbol: 1}, _INTEGRAL)
         else:
             equivalent = Unum.uniform(definition)
             equivalent._normal = True
             level = equivalent.max_level() + 1
+            expansion = self.expand(equivalent._unit, equivalent._value)
 
-        self[symbol] = UnitDefinition(equivalent, level, name)
+        self[symbol] = UnitDefinition(equivalent, level, name, expansion, prefixable)
+        self.version += 1
 
         return Unum(1, {symbol: 1}, normal=True)
 
+    def _new_erased_unit(self, symbol, definition, name, prefixable):
+        """
+        Define unit by its value in basic units, stored as a dimensionless expansion.
+        """
+
+        value = 1.0 if definition == BASIC_UNIT else float(definition)
+
+        self[symbol] = UnitDefinition(None, 0, name, Expansion(Fraction(value), {}, _REAL), prefixable)
+        self.version += 1
+
+        return value
+
+
+class UnitCache(object):
+    """
+    Bounded cache of values computed from unit table content.
+
+    The least recently used entries are evicted when max_size is exceeded,
+    and all entries are dropped when the version of the table changes.
+    """
+
+    def __init__(self, table, max_size=1024):
+        self.max_size = max_size
+        self._table = table
+        self._version = table.version
+        self._data = collections.OrderedDict()
+
+    def __getitem__(self, key):
+        self._validate()
+
+        value = self._data.pop(key)
+        self._data[key] = value
+
+        return value
+
+    def __setitem__(self, key, value):
+        self._validate()
+
+        self._data[key] = value
+
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def __len__(self):
+        self._validate()
+
+        return len(self._data)
+
+    def clear(self):
+        self._data.clear()
+
+    def _validate(self):
+        if self._version != self._table.version:
+            self._data.clear()
+            self._version = self._table.version
+
 
 UNIT_TABLE = UnitTable()
 
 new_unit = UNIT_TABLE.new_unit
+new_prefix = UNIT_TABLE.new_prefix
+get_unit = UNIT_TABLE.get_unit
+
+
+def erase_units():
+    """
+    Switch to production mode, where units are plain floats: new_unit and get_unit return values
+    of units in basic units (coherent SI units for unum.units), so calculations have no overhead
+    and no unit checking. Helpers of unum.utils treat numbers as quantities in basic units.
+
+    Must be called before any unit is defined, i.e. before unum.units is imported. The mode can
+    also be chosen by setting environment variable UNUM_ERASE_UNITS=1.
+
+    :raises UnumError: if some units are already defined
+    """
+
+    if UNIT_TABLE and not UNIT_TABLE.erased:
+        raise UnumError("units can't be erased after they are defined")
+
+    UNIT_TABLE.erased = True
+
+
+if os.environ.get('UNUM_ERASE_UNITS', '0') != '0':
+    erase_units()
+
+# {(unit signature, forDisplay, budget): (simplified unit or None, factor)}
+SIMPLIFY_CACHE = UnitCache(UNIT_TABLE)
 
 
 _SUPERSCRIPT_NUMBERS = {
@@ -103,7 +640,7 @@ class Formatter(object):
         Return a string representation of our unit.
         """
 
-        units = sorted(unit.items())
+        units = unit.sorted_items
 
         formatted = (
             self._format_only_mul_separator(units) if not self['div_separator'] else
@@ -161,6 +698,110 @@ class Formatter(object):
     __call__ = format
 
 
+def _new_unum(value, unit):
+    """
+    Return Unum of value and UnitSignature unit, faster than the constructor which converts the unit.
+    """
+
+    result = _new_object(Unum)
+    result._value = value
+    result._unit = unit
+    result._normal = False
+
+    return result
+
+
+_new_object = object.__new__
+
+
+def _split(value):
+    """
+    Return (value, UnitSignature) of Unum or unitless value.
+    """
+
+    if isinstance(value, Unum):
+        return value._value, value._unit
+
+    return value, EMPTY_SIGNATURE
+
+
+def _is_array(value):
+    numpy = sys.modules.get('numpy')  # value can't be an array if numpy is not imported
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+
+def _is_zero(value):
+    return not _is_array(value) and value == 0  # zero arrays keep their unit
+
+
+def _can_update(target, value, division=False):
+    """
+    Return True if target is a writeable numpy array, which can store the result of arithmetic
+    with value in place, because the result would have the same type and shape.
+    """
+
+    if not _is_array(target) or not target.flags.writeable:
+        return False
+
+    numpy = sys.modules['numpy']
+
+    try:
+        dtype = numpy.result_type(target, value, 1.0) if division else numpy.result_type(target, value)
+        return dtype == target.dtype and numpy.broadcast(target, value).shape == target.shape
+    except (TypeError, ValueError, OverflowError):
+        return False
+
+
+def _match(s_value, s_unit, o_value, o_unit):
+    """
+    Return (s value, o value, common unit) for values of UnitSignatures s unit and o unit,
+    see Unum.match_units.
+    """
+
+    if s_unit is o_unit:
+        return s_value, o_value, s_unit
+
+    if _is_zero(s_value):
+        return s_value, o_value, o_unit
+
+    if _is_zero(o_value):
+        return s_value, o_value, s_unit
+
+    s_length, o_length = len(s_unit), len(o_unit)
+
+    if s_length > o_length or (s_length == o_length and s_unit.max_level() < o_unit.max_level()):
+        factor = s_unit.conversion_factor(o_unit)
+
+        if factor is None:
+            raise IncompatibleUnitsError(Unum(s_value, s_unit), Unum(o_value, o_unit))
+
+        return (s_value if factor == 1 else s_value * factor), o_value, o_unit
+    else:
+        factor = o_unit.conversion_factor(s_unit)
+
+        if factor is None:
+            raise IncompatibleUnitsError(Unum(s_value, s_unit), Unum(o_value, o_unit))
+
+        return s_value, (o_value if factor == 1 else o_value * factor), s_unit
+
+
+def _unum_list(values, unit):
+    return [_unum_list(item, unit) if isinstance(item, list) else _new_unum(item, unit) for item in values]
+
+
+def _unpickle_array(data, dtype, shape, order, unit, normal):
+    """
+    Return Unum of numpy array using the buffer of data, see Unum.__reduce_ex__.
+    """
+
+    import numpy
+
+    result = _new_unum(numpy.frombuffer(data, dtype).reshape(shape, order=order), unit)
+    result._normal = normal
+
+    return result
+
+
 def uniform_unum(func):
     def decorator(self, value):
         return func(self, Unum.uniform(value))
@@ -178,6 +819,12 @@ class Unum(object):
 
     __slots__ = ('_value', '_unit', '_normal')
 
+    # maximal number of units checked by simplify_unit, None means no limit
+    SIMPLIFY_BUDGET = None
+
+    # numpy arrays defer to Unum operators, so ndarray * Unum is a Unum wrapping the array
+    __array_priority__ = 1000
+
     @staticmethod
     def uniform(value):
         """
@@ -207,18 +854,18 @@ class Unum(object):
         """
 
         self._value = value
-        self._unit = {} if unit is None else dict(unit)
+        self._unit = EMPTY_SIGNATURE if unit is None else UnitSignature(unit)
         self._normal = normal
 
     def unit(self):
-        return Unum(1, self._unit.copy())
+        return _new_unum(1, self._unit)
 
     def copy(self, normalized=False):
         """
         Return a copy of this Unum, normalizing the copy if specified.
         """
 
-        result = Unum(self._value, self._unit.copy())
+        result = _new_unum(self._value, self._unit)
 
         if normalized:
             result.simplify_unit()
@@ -237,14 +884,14 @@ class Unum(object):
         if not other.is_basic():
             raise NonBasicUnitError(other)
 
-        s, o = self.match_units(other)
-        res = Unum(s._value / o._value, other._unit)
+        s, o, _ = self._match_values(other)
+        res = Unum(s / o, other._unit)
         res._normal = True
 
         return res
 
     def is_basic(self):
-        return self._value == 1
+        return not _is_array(self._value) and self._value == 1
 
     is_unit = is_basic
 
@@ -257,9 +904,8 @@ class Unum(object):
 
         exponent = self._unit[symbol]
 
-        res = self.copy() * definition ** exponent
-        del res._unit[symbol]
-        return res
+        return Unum(self._value * definition._value ** exponent,
+                    _substituted(self._unit, symbol, definition._unit, exponent))
 
     def simplify_unit(self, forDisplay=False):
         """
@@ -269,33 +915,84 @@ class Unum(object):
         while making the fewest substitutions.
 
         If forDisplay is True, then prefer a single unit to no unit.
+
+        If more than Unum.SIMPLIFY_BUDGET units were checked, the search stops and
+        the expansion to basic units is used if it is shorter than the best unit found.
+
+        Results of the search are memoized per unit in SIMPLIFY_CACHE.
         """
 
         # TODO: example of forDisplay.
-        # TODO: simplify normalize so it fits in 80 columns...
-
-        previous_length = len(self._unit)
-        new_subst_unums = [({}, self.copy())]
-
-        while new_subst_unums:
-            subst_unums, new_subst_unums = new_subst_unums, []
-            for subst_dict, subst_unum in subst_unums:
-                for symbol, exponent in subst_unum._derived_units():
-                    new_subst_dict = subst_dict.copy()
-                    new_subst_dict[symbol] = exponent + new_subst_dict.get(symbol, 0)
-
-                    if all(new_subst_dict != subst_dict2 for subst_dict2, subst_unum2 in new_subst_unums):
-                        reduced = subst_unum.replaced(symbol, UNIT_TABLE.get_definition(symbol)) # replace by definition
-                        new_subst_unums.append((new_subst_dict, reduced))
-
-                        new_length = len(reduced._unit)
-                        if new_length < previous_length and not (forDisplay and new_length == 0 and previous_length == 1):
-                            self._value, self._unit = reduced._value, reduced._unit
-                            previous_length = new_length
+
+        budget = self.SIMPLIFY_BUDGET
+        key = self._unit, forDisplay, budget
+
+        try:
+            unit, factor = SIMPLIFY_CACHE[key]
+        except KeyError:
+            unit, factor = SIMPLIFY_CACHE[key] = self._search_simplest_unit(forDisplay, budget)
+
+        if unit is not None:
+            self._value, self._unit = self._value * factor, unit
+
         return self
 
-    def _derived_units(self):
-        return [(symbol, self._unit[symbol]) for symbol in self._unit if UNIT_TABLE.is_derived(symbol)]
+    def _search_simplest_unit(self, forDisplay, budget):
+        """
+        Breadth-first search of the shortest unit reachable by substitutions of derived units.
+
+        Every reachable unit is visited once. If budget (number of visited units) is exceeded
+        the expansion to basic units is used when it is shorter than the best unit found.
+
+        :return: (unit, factor) where 1 [self unit] is equal to factor [unit],
+            or (None, 1) if self unit can't be simplified
+        """
+
+        best = None, 1
+        best_length = len(self._unit)
+        visited = {frozenset(self._unit.items())}
+        frontier = [(self._unit, 1)]
+
+        while frontier:
+            current, frontier = frontier, []
+
+            for unit, factor in current:
+                for symbol, exponent in unit.items():
+                    definition = UNIT_TABLE.get_definition(symbol)
+
+                    if definition is None:
+                        continue
+
+                    reduced = _substituted(unit, symbol, definition._unit, exponent)
+                    key = frozenset(reduced.items())
+
+                    if key in visited:
+                        continue
+
+                    visited.add(key)
+                    reduced_factor = factor * definition._value ** exponent
+                    frontier.append((reduced, reduced_factor))
+
+                    length = len(reduced)
+                    if length < best_length and not (forDisplay and length == 0 and best_length == 1):
+                        best, best_length = (reduced, reduced_factor), length
+
+                        if best_length == 0 or (forDisplay and best_length == 1):
+                            return UnitSignature(reduced), reduced_factor  # nothing shorter is acceptable
+
+                    if budget is not None and len(visited) > budget:
+                        return self._shorter_than_expansion(best, best_length, forDisplay)
+
+        return best if best[0] is None else (UnitSignature(best[0]), best[1])
+
+    def _shorter_than_expansion(self, best, best_length, forDisplay):
+        expansion = UNIT_TABLE.expand(self._unit)
+        length = len(expansion.unit)
+
+        if length < best_length and not (forDisplay and length == 0 and best_length == 1):
+            return UnitSignature(expansion.unit), _ratio(expansion, _UNITLESS_EXPANSION)
+
+        return best if best[0] is None else (UnitSignature(best[0]), best[1])
 
     def assert_no_unit(self):
         """
@@ -310,7 +1007,7 @@ class Unum(object):
         :return: the maximum level of self's units
         """
 
-        return max([0] + [UNIT_TABLE[symbol].level for symbol in self._unit])
+        return self._unit.max_level()
 
     def number(self, unit=None):
         """
@@ -330,8 +1027,8 @@ class Unum(object):
             if not unit.is_unit():
                 raise NonBasicUnitError(unit)
 
-            s, o = self.match_units(unit)
-            return s._value / o._value
+            s, o, _ = self._match_values(unit)
+            return s / o
         else:
             s = self.copy(True)
             s.assert_no_unit()
@@ -347,39 +1044,42 @@ class Unum(object):
         """
         assert isinstance(other, Unum)
 
-        if self._unit == other._unit:
-            return self, other
+        s_value, o_value, unit = self._match_values(other)
 
-        if self._value == 0:
-            return Unum(self._value, other._unit), other
+        s = self if unit is self._unit else _new_unum(s_value, unit)
+        o = other if unit is other._unit else _new_unum(o_value, unit)
 
-        if other._value == 0:
-            return self, Unum(other._value, self._unit)
+        return s, o
 
-        s = self.copy()
-        o = other.copy()
+    def _match_values(self, other):
+        """
+        Same as match_units, but return (self value, other value, common unit) without creating new Unums.
 
-        s_length, o_length = len(s._unit), len(o._unit)
+        :param other: Unum or unitless value
+        """
 
-        revert = (s_length > o_length or
-                  (s_length == o_length and s.max_level() < o.max_level()))
+        o_value, o_unit = _split(other)
+        return _match(self._value, self._unit, o_value, o_unit)
 
-        if revert:
-            s, o = o, s
+    def _converted(self, other):
+        """
+        Return value of other (Unum or unitless value) expressed in self unit.
+        """
+
+        value, unit = _split(other)
 
-        target_unum = Unum(1, s._unit)
-        o /= target_unum
-        o.simplify_unit()
+        if unit is self._unit:
+            return value
 
-        if o._unit:
-            raise IncompatibleUnitsError(self, other)
+        factor = unit.conversion_factor(self._unit)
 
-        o._unit = s._unit
+        if factor is None:
+            if isinstance(value, numbers.Number) and value == 0:
+                return value
 
-        if revert:
-            s, o = o, s
+            raise IncompatibleUnitsError(self, Unum(value, unit))
 
-        return s, o
+        return value if factor == 1 else value * factor
 
     def format_number(self, func):
         return func(self._value)
@@ -387,120 +1087,82 @@ class Unum(object):
     def format_unit(self, func):
         return func(self._unit)
 
-    @uniform_unum
     def __add__(self, other):
-        s, o = self.match_units(other)
-        return Unum(s._value + o._value, s._unit)
+        s, o, unit = self._match_values(other)
+        return _new_unum(s + o, unit)
 
-    @uniform_unum
     def __sub__(self, other):
-        s, o = self.match_units(other)
-        return Unum(s._value - o._value, s._unit)
+        s, o, unit = self._match_values(other)
+        return _new_unum(s - o, unit)
 
     def __pos__(self):
         return self
 
     def __neg__(self):
-        return Unum(-self._value, self._unit)
+        return _new_unum(-self._value, self._unit)
 
-    @uniform_unum
     def __mul__(self, other):
-        if not self._unit:
-            unit = other._unit
-        elif not other._unit:
-            unit = self._unit
-        else:
-            unit = self._unit.copy()
-            for u, exp in other._unit.items():
-                exp += unit.get(u, 0)
-                if exp:
-                    unit[u] = exp
-                else:
-                    del unit[u]
+        if isinstance(other, Unum):
+            return _new_unum(self._value * other._value, self._unit * other._unit)
 
-        return Unum(self._value * other._value, unit)
+        return _new_unum(self._value * other, self._unit)
 
-    @uniform_unum
     def __div__(self, other):
-        if not other._unit:
-            unit = self._unit
-        else:
-            unit = self._unit.copy()
-            for u, exp in list(other._unit.items()):
-                exp -= unit.get(u, 0)
-                if exp:
-                    unit[u] = -exp
-                else:
-                    del unit[u]
-        return Unum(self._value / other._value, unit)
+        if isinstance(other, Unum):
+            return _new_unum(self._value / other._value, self._unit / other._unit)
+
+        return _new_unum(self._value / other, self._unit)
 
     __truediv__ = __div__  # Python 3.0 compatibility.
 
-    @uniform_unum
     def __floordiv__(self, other):
-        if not other._unit:
-            unit = self._unit
-        else:
-            unit = self._unit.copy()
-            for u, exp in list(other._unit.items()):
-                exp -= unit.get(u, 0)
-                if exp:
-                    unit[u] = -exp
-                else:
-                    del unit[u]
-        return Unum(self._value // other._value, unit)
+        if isinstance(other, Unum):
+            return _new_unum(self._value // other._value, self._unit / other._unit)
+
+        return _new_unum(self._value // other, self._unit)
 
-    @uniform_unum
     def __pow__(self, other):
-        if other._value:
-            other = other.copy(True)
-            other.assert_no_unit()
-            unit = self._unit.copy()
-            for u in list(self._unit.keys()):
-                unit[u] *= other._value
-        else:
-            unit = None
-        return Unum(self._value ** other._value, unit)
+        if isinstance(other, Unum):
+            if other._value:
+                other = other.copy(True)
+                other.assert_no_unit()
+            other = other._value
+
+        return _new_unum(self._value ** other, self._unit ** other if other else EMPTY_SIGNATURE)
 
-    @uniform_unum
     def __lt__(self, other):
-        s, o = self.match_units(other)
-        return s._value < o._value
+        s, o, _ = self._match_values(other)
+        return s < o
 
-    @uniform_unum
     def __le__(self, other):
-        s, o = self.match_units(other)
-        return s._value <= o._value
+        s, o, _ = self._match_values(other)
+        return s <= o
 
-    @uniform_unum
     def __gt__(self, other):
-        s, o = self.match_units(other)
-        return s._value > o._value
+        s, o, _ = self._match_values(other)
+        return s > o
 
-    @uniform_unum
     def __ge__(self, other):
-        s, o = self.match_units(other)
-        return s._value >= o._value
+        s, o, _ = self._match_values(other)
+        return s >= o
 
-    @uniform_unum
     def __eq__(self, other):
         try:
-            s, o = self.match_units(other)
+            s, o, _ = self._match_values(other)
         except IncompatibleUnitsError:
             return False
 
-        return s._value == o._value
+        return s == o
 
-    @uniform_unum
     def __ne__(self, other):
         try:
-            s, o = self.match_units(other)
+            s, o, _ = self._match_values(other)
         except IncompatibleUnitsError:
             return True
-        return s._value != o._value
+        return s != o
 
     def __abs__(self):
-        return Unum(abs(self._value), self._unit)
+        return _new_unum(abs(self._value), self._unit)
 
     def __complex__(self):
         return complex(self.number(1))
@@ -514,41 +1176,117 @@ class Unum(object):
     def __float__(self):
         return float(self.number(1))
 
-    @uniform_unum
+    # in-place operators update numpy array value if it can store the result, other values are immutable
+
+    def __iadd__(self, other):
+        if _is_array(self._value):
+            value = self._converted(other)
+
+            if _can_update(self._value, value):
+                self._value += value
+                return self
+
+        return self.__add__(other)
+
+    def __isub__(self, other):
+        if _is_array(self._value):
+            value = self._converted(other)
+
+            if _can_update(self._value, value):
+                self._value -= value
+                return self
+
+        return self.__sub__(other)
+
+    def __imul__(self, other):
+        value, unit = _split(other)
+
+        if not _can_update(self._value, value):
+            return self.__mul__(other)
+
+        self._value *= value
+        self._unit, self._normal = self._unit * unit, False
+        return self
+
+    def __idiv__(self, other):
+        value, unit = _split(other)
+
+        if not _can_update(self._value, value, division=True):
+            return self.__div__(other)
+
+        self._value /= value
+        self._unit, self._normal = self._unit / unit, False
+        return self
+
+    __itruediv__ = __idiv__  # Python 3.0 compatibility.
+
+    # reflected operators are called only with values which are not Unums
+
     def __radd__(self, other):
-        return other.__add__(self)
+        o, s, unit = _match(other, EMPTY_SIGNATURE, self._value, self._unit)
+        return _new_unum(o + s, unit)
 
-    @uniform_unum
     def __rsub__(self, other):
-        return other.__sub__(self)
+        o, s, unit = _match(other, EMPTY_SIGNATURE, self._value, self._unit)
+        return _new_unum(o - s, unit)
 
-    @uniform_unum
     def __rmul__(self, other):
-        return other.__mul__(self)
+        return _new_unum(other * self._value, self._unit)
 
-    @uniform_unum
     def __rdiv__(self, other):
-        return other.__div__(self)
+        return _new_unum(other / self._value, EMPTY_SIGNATURE / self._unit)
 
     __rtruediv__ = __rdiv__  # Python 3.0 compatibility.
 
-    @uniform_unum
     def __rfloordiv__(self, other):
-        return other.__floordiv__(self)
+        return _new_unum(other // self._value, EMPTY_SIGNATURE / self._unit)
 
-    @uniform_unum
     def __rpow__(self, other):
-        return other.__pow__(self)
+        return Unum(other).__pow__(self)
+
+    # numpy ufuncs and functions are computed on the value, with units checked and propagated
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        from ._numpy import array_ufunc
+        return array_ufunc(ufunc, method, inputs, kwargs)
+
+    def __array_function__(self, function, types, args, kwargs):
+        from ._numpy import array_function
+        return array_function(function, types, args, kwargs)
 
     def __getitem__(self, index):
-        return Unum(self._value[index], self._unit)
+        return _new_unum(self._value[index], self._unit)
 
     def __setitem__(self, index, value):
-        self._value[index] = Unum.uniform(value).number(self.unit())
+        # value is converted with one factor, then numpy assigns it to (fancy) index with broadcasting
+        self._value[index] = self._converted(value)
 
     def __len__(self):
         return len(self._value)
 
+    # elements of sequence values share the unit signature of this Unum
+
+    def __iter__(self):
+        unit = self._unit
+        return (_new_unum(item, unit) for item in self._value)
+
+    def tolist(self):
+        """
+        Return (nested) list of Unums of elements of value, numpy arrays give Python numbers.
+        """
+
+        value = self._value
+        return _unum_list(value.tolist() if _is_array(value) else list(value), self._unit)
+
+    def chunks(self, size):
+        """
+        Return iterator over Unums of consecutive parts of value having size elements (the last one
+        can be shorter), which are views of numpy arrays.
+        """
+
+        value, unit = self._value, self._unit
+        return (_new_unum(value[start:start + size], unit) for start in six.moves.range(0, len(value), size))
+
     def __bool__(self):
         return bool(self._value)
 
@@ -560,7 +1298,34 @@ class Unum(object):
     __repr__ = __str__
 
     def __getstate__(self):
-        return self._value, self._unit.copy(), self._normal
+        value = self._value
+
+        if _is_array(value) and isinstance(value, sys.modules['numpy'].memmap):
+            from .storage import pickled_value
+            value = pickled_value(value)  # file mapping is pickled without data
+
+        return value, self._unit, self._normal
 
     def __setstate__(self, state):
-        self._value, self._unit, self._normal = state
+        value, unit, self._normal = state
+
+        if not isinstance(unit, UnitSignature):  # dict of older pickles
+            unit = _registered_signature(*[item for pair in unit.items() for item in pair])
+
+        self._value, self._unit = value, unit
+
+    def __reduce_ex__(self, protocol):
+        value = self._value
+
+        # with protocol 5 data of contiguous numpy arrays is given to pickle as a buffer, which
+        # can be passed out-of-band (see pickle.PickleBuffer), other values are pickled by state
+        if protocol >= 5 and type(value) is getattr(sys.modules.get('numpy'), 'ndarray', None) and \
+                not value.dtype.hasobject and (value.flags.c_contiguous or value.flags.f_contiguous):
+            import pickle  # imported by the caller already, not needed by import of unum
+
+            order = 'C' if value.flags.c_contiguous else 'F'
+            data = pickle.PickleBuffer(value if order == 'C' else value.T)
+
+            return _unpickle_array, (data, value.dtype, value.shape, order, self._unit, self._normal)
+
+        return object.__reduce_ex__(self, protocol)
@@ -26,6 +26,17 @@ class IncompatibleUnitsError(TypeError):
         )
 
 
+class IncompatibleElementError(IncompatibleUnitsError):
+    """
+    An element of a sequence had units incompatible with the units of the result.
+    """
+
+    def __init__(self, index, unit1, unit2):
+        IncompatibleUnitsError.__init__(self, unit1, unit2)
+        self.index = index
+        self.args = ("element %d: %s" % (index, self.args[0]),)
+
+
 class ConversionError(UnumError):
     """
     Failed to convert a unit to the desired type.
@@ -44,6 +55,17 @@ class NameConflictError(UnumError):
         UnumError.__init__(self, "%s is already defined." % unit_key)
 
 
+class UnknownUnitError(UnumError, KeyError):
+    """
+    Used a unit symbol which is not defined.
+    """
+
+    def __init__(self, unit_key):
+        UnumError.__init__(self, "%s is not defined." % unit_key)
+
+    __str__ = UnumError.__str__
+
+
 class NonBasicUnitError(UnumError):
     """
     Expected a basic unit but got a non-basic unit.
@@ -0,0 +1,212 @@
+"""Columnar table of quantities.
+
+Each column of a QuantityFrame is a contiguous one-dimensional numpy array with one unit, so
+operations on columns are computed on whole arrays and values are never wrapped in Unums one by one:
+
+    >>> trips = QuantityFrame(distance=km * array([12., 30.]), time=h * array([.25, .5]))
+    >>> trips['speed'] = trips['distance'] / trips['time']
+    >>> trips[trips['speed'] > 50 * km / h]
+"""
+from __future__ import division
+
+import collections
+import numbers
+
+import numpy
+import six
+from six.moves import collections_abc
+
+from .core import EMPTY_SIGNATURE, Unum, _new_unum, _split
+from .exceptions import IncompatibleUnitsError, NonBasicUnitError
+from .utils import collapse
+
+MAX_PRINTED_ROWS = 20  # longer frames are printed as first and last rows
+
+
+class QuantityFrame(object):
+    """
+    Ordered columns of equal length named by strings, each one is a numpy array with UnitSignature.
+
+    Column is got as a Unum wrapping the stored array (not a copy). Rows are selected with a slice,
+    which gives views of arrays, or with a boolean mask or integer array, which give copies.
+    Integer gives one row as an ordered mapping of names to Unums.
+    """
+
+    __slots__ = ('_columns', '_length')
+
+    def __init__(self, columns=(), **kwargs):
+        """
+        :param columns: mapping or sequence of (name, Unum or array-like) pairs
+        :param kwargs: more columns given by names, added in order of arguments (in Python 3.6+)
+        """
+
+        self._columns = collections.OrderedDict()  # {name: (array, UnitSignature)}
+        self._length = None
+
+        items = columns.items() if isinstance(columns, collections_abc.Mapping) else columns
+
+        for name, value in list(items) + list(kwargs.items()):
+            self[name] = value
+
+    @classmethod
+    def _from_columns(cls, columns, length):
+        result = cls.__new__(cls)
+        result._columns, result._length = columns, length
+
+        return result
+
+    def __len__(self):
+        return self._length or 0
+
+    def __contains__(self, name):
+        return name in self._columns
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def keys(self):
+        return list(self._columns)
+
+    def items(self):
+        return [(name, _new_unum(array, unit)) for name, (array, unit) in self._columns.items()]
+
+    def unit(self, name):
+        return _new_unum(1, self._columns[name][1])
+
+    def number(self, name, unit=None):
+        """
+        Return array of column, converted to unit if it is given (see Unum.number).
+        """
+
+        array, source = self._columns[name]
+
+        if unit is None:
+            return array
+
+        return array * self._factor(name, source, unit)
+
+    def cast_unit(self, name, unit):
+        """
+        Return frame, which shares other columns with this one, where column is converted to unit.
+
+        :raises IncompatibleUnitsError: if column can't be converted to unit
+        :raises NonBasicUnitError: if unit isn't a basic unit
+        """
+
+        array, source = self._columns[name]
+        columns = self._columns.copy()
+        columns[name] = array * self._factor(name, source, unit), unit._unit
+
+        return self._from_columns(columns, self._length)
+
+    def _factor(self, name, source, unit):
+        if not isinstance(unit, Unum) or not unit.is_basic():
+            raise NonBasicUnitError(unit)
+
+        factor = source.conversion_factor(unit._unit)
+
+        if factor is None:
+            raise IncompatibleUnitsError(self.unit(name), unit)
+
+        return factor
+
+    def copy(self):
+        columns = collections.OrderedDict(
+            (name, (array.copy(), unit)) for name, (array, unit) in self._columns.items()
+        )
+
+        return self._from_columns(columns, self._length)
+
+    def __getitem__(self, key):
+        """
+        :param key: name of column (return Unum), list of names (return frame of these columns),
+            index of row (return OrderedDict of names and Unums of the row),
+            or slice, boolean mask or integer array of rows (return frame of these rows)
+        :raises IndexError: if index of row is out of range
+        :raises TypeError: if key is a scalar of other type (e.g. float)
+        """
+
+        if isinstance(key, six.string_types):
+            array, unit = self._columns[key]
+            return _new_unum(array, unit)
+
+        if isinstance(key, numbers.Integral) and not isinstance(key, (bool, numpy.bool_)):
+            if not -len(self) <= key < len(self):
+                raise IndexError("row %d is out of range of frame of %d rows" % (key, len(self)))
+
+            return collections.OrderedDict(
+                (name, _new_unum(array[key], unit)) for name, (array, unit) in self._columns.items()
+            )
+
+        if isinstance(key, list) and all(isinstance(name, six.string_types) for name in key):
+            columns = collections.OrderedDict((name, self._columns[name]) for name in key)
+            return self._from_columns(columns, self._length if columns else None)
+
+        rows = _split(key)[0]
+
+        if numpy.ndim(rows) == 0 and not isinstance(rows, slice):
+            raise TypeError("frame key must be a column name, list of names, row index, slice, or array, got %r"
+                            % (key,))
+
+        columns = collections.OrderedDict((name, (array[rows], unit)) for name, (array, unit) in self._columns.items())
+        length = len(next(iter(columns.values()))[0]) if columns else None
+
+        return self._from_columns(columns, length)
+
+    def __setitem__(self, name, value):
+        """
+        Store Unum or array-like as column, numbers are repeated in every row.
+
+        Sequence of Unums is converted to the unit of the first one.
+
+        :raises IncompatibleUnitsError: if Unums of sequence have incompatible units
+        """
+
+        value, unit = _split(value)
+        array = numpy.asarray(value)
+
+        if array.dtype == object and unit is EMPTY_SIGNATURE:
+            array, unit = _split(collapse(array))
+
+        if array.ndim == 0:
+            if self._length is None:
+                raise ValueError("length of column %r is unknown" % name)
+
+            array = numpy.full(self._length, array[()])
+
+        if array.ndim != 1:
+            raise ValueError("column %r is not one-dimensional" % name)
+
+        if self._length is not None and len(array) != self._length and not (
+                len(self._columns) == 1 and name in self._columns):
+            raise ValueError("column %r has %d rows, expected %d" % (name, len(array), self._length))
+
+        self._columns[name] = numpy.ascontiguousarray(array), unit
+        self._length = len(array)
+
+    def __delitem__(self, name):
+        del self._columns[name]
+
+        if not self._columns:
+            self._length = None
+
+    def __str__(self):
+        header = ['%s %s' % (name, Unum.formatter.format_unit(self.unit(name))) for name in self._columns]
+        arrays = [array for array, _ in self._columns.values()]
+
+        if len(self) > MAX_PRINTED_ROWS:
+            half = MAX_PRINTED_ROWS // 2
+            rows = ([header] + _cells([array[:half] for array in arrays]) + [['...'] * len(header)] +
+                    _cells([array[-half:] for array in arrays]))
+        else:
+            rows = [header] + _cells(arrays)
+
+        widths = [max(len(row[index]) for row in rows) for index in range(len(header))]
+
+        return '\n'.join('  '.join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows)
+
+    __repr__ = __str__
+
+
+def _cells(arrays):
+    return [[str(value) for value in row] for row in zip(*arrays)]
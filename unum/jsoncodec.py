@@ -0,0 +1,152 @@
+"""JSON encoding of documents containing Unums.
+
+Unums are written as objects {"__unum__": value, "unit": {symbol: exponent}}, numpy arrays as lists
+and iterators as lists of their items. Arrays and iterators are written in parts when the document
+is encoded, so they aren't copied to lists at once, and dump writes the document to the file part
+by part:
+
+    >>> dumps({'span': 2 * m, 'loads': kN * array([1., 2.5])})
+    '{"span": {"__unum__": 2, "unit": {"m": 1}}, "loads": {"__unum__": [1.0, 2.5], "unit": {"kN": 1}}}'
+    >>> loads(_)
+    {'span': 2 [m], 'loads': [1.  2.5] [kN]}
+"""
+from __future__ import division
+
+import collections
+import json
+import re
+import sys
+import uuid
+
+from six.moves import collections_abc
+
+from .core import Unum, _new_unum, _registered_signature
+
+_KEY = '__unum__'
+
+
+class UnumEncoder(json.JSONEncoder):
+    """
+    JSONEncoder of Unums, numpy arrays and iterators.
+    """
+
+    # number of array elements or iterator items encoded at once
+    CHUNK_SIZE = 65536
+
+    def default(self, o):
+        if isinstance(o, Unum):
+            return {_KEY: o._value, 'unit': dict(o._unit)}
+
+        numpy = sys.modules.get('numpy')
+
+        if numpy is not None and isinstance(o, (numpy.generic, numpy.ndarray)) and not o.shape:
+            return o.item()
+
+        if numpy is not None and isinstance(o, numpy.ndarray) or isinstance(o, collections_abc.Iterator):
+            self._deferred.append(o)
+            return '%s%d' % (self._marker, len(self._deferred) - 1)  # replaced by elements in iterencode
+
+        return json.JSONEncoder.default(self, o)
+
+    def encode(self, o):
+        return ''.join(self.iterencode(o, _one_shot=True))
+
+    def iterencode(self, o, _one_shot=False):
+        """
+        Encode o and yield parts of the string, arrays and iterators are encoded CHUNK_SIZE elements at once.
+
+        default returns strings of a random marker of this call and an index in place of arrays and iterators,
+        JSONEncoder writes every string in one part, so they're found and replaced in parts of the result.
+        """
+
+        state = getattr(self, '_marker', None), getattr(self, '_deferred', None)
+        self._marker, self._deferred = uuid.uuid4().hex, []
+        placeholder = re.compile('"%s(\\d+)"' % self._marker)
+
+        try:
+            for chunk in json.JSONEncoder.iterencode(self, o, _one_shot):
+                parts = placeholder.split(chunk)
+
+                for index, part in enumerate(parts):
+                    if index % 2:
+                        for item in self._iterencode_deferred(self._deferred[int(part)]):
+                            yield item
+                    elif part:
+                        yield part
+        finally:
+            self._marker, self._deferred = state
+
+    def _iterencode_deferred(self, value):
+        yield '['
+
+        if isinstance(value, collections_abc.Iterator):
+            first = True
+
+            for item in value:
+                if not first:
+                    yield self.item_separator
+
+                first = False
+
+                for chunk in self.iterencode(item, _one_shot=True):
+                    yield chunk
+        else:
+            rows = max(1, self.CHUNK_SIZE // max(1, value[:1].size))
+
+            for start in range(0, len(value), rows):
+                if start:
+                    yield self.item_separator
+
+                yield self._array_encoder().encode(value[start:start + rows].tolist())[1:-1]
+
+        yield ']'
+
+    def _array_encoder(self):
+        return json.JSONEncoder(allow_nan=self.allow_nan, separators=(self.item_separator, self.key_separator))
+
+
+def object_hook(obj):
+    """
+    Return Unum of JSON object written by UnumEncoder, or the object, lists of numbers are converted to numpy arrays.
+
+    :raises UnknownUnitError: if a unit of the object isn't defined (modules of units are loaded, see unum.units)
+    """
+
+    if _KEY not in obj:
+        return obj
+
+    value = obj[_KEY]
+
+    if isinstance(value, list):
+        import numpy
+        value = numpy.array(value)
+
+    return _new_unum(value, _registered_signature(*[item for pair in obj['unit'].items() for item in pair]))
+
+
+def object_pairs_hook(pairs):
+    """
+    Same as object_hook, but other objects are returned as OrderedDict.
+    """
+
+    return object_hook(collections.OrderedDict(pairs))
+
+
+def dumps(obj, **kwargs):
+    return json.dumps(obj, cls=UnumEncoder, **kwargs)
+
+
+def dump(obj, fp, **kwargs):
+    """
+    Write obj to text file fp part by part.
+    """
+
+    json.dump(obj, fp, cls=UnumEncoder, **kwargs)
+
+
+def loads(s, **kwargs):
+    return json.loads(s, object_hook=object_hook, **kwargs)
+
+
+def load(fp, **kwargs):
+    return json.load(fp, object_hook=object_hook, **kwargs)
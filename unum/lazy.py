@@ -0,0 +1,359 @@
+"""Lazy evaluation of arithmetic on Unums.
+
+Operations on LazyUnums build an expression tree instead of computing values. Units are computed
+and checked while the tree is built, so incompatible units are reported immediately. The value is
+computed when it is needed (e.g. by number, cast_unit or formatting), in one pass over chunks of
+numpy arrays, so temporary arrays have the size of a chunk instead of the size of the result:
+
+    >>> force = 0.5 * lazy(rho) * v ** 2 * A * Cd
+    >>> force.number(N)
+"""
+from __future__ import division
+
+import __future__
+import operator
+import sys
+
+from .core import EMPTY_SIGNATURE, Unum, _is_zero, _split
+from .exceptions import IncompatibleUnitsError
+
+_PENDING = object()  # value of LazyUnum not computed yet
+
+
+def lazy(value):
+    """
+    Return LazyUnum with value of Unum or unitless value.
+    """
+
+    if isinstance(value, LazyUnum):
+        return value
+
+    value, unit = _split(value)
+
+    return LazyUnum(value, unit)
+
+
+class LazyUnum(Unum):
+    """
+    Unum which value is computed when it is used for the first time.
+
+    As with Unum, zero Unums and numbers are matched with any unit when they are added (so sum
+    of LazyUnums works), but LazyUnums equal to zero aren't, because their values aren't known
+    when units are matched.
+    """
+
+    __slots__ = ('_expression', '_result')
+
+    # number of array elements computed at once
+    CHUNK_SIZE = 65536
+
+    @property
+    def _value(self):
+        if self._result is _PENDING:
+            self._result = _compute(self._expression, self.CHUNK_SIZE)
+            self._expression = (None, self._result)  # release operands
+
+        return self._result
+
+    @_value.setter
+    def _value(self, value):
+        self._expression, self._result = (None, value), value
+
+    def is_computed(self):
+        return self._result is not _PENDING
+
+    def __add__(self, other):
+        return _sum(operator.add, self, other)
+
+    def __sub__(self, other):
+        return _sum(operator.sub, self, other)
+
+    def __radd__(self, other):
+        return _sum(operator.add, other, self)
+
+    def __rsub__(self, other):
+        return _sum(operator.sub, other, self)
+
+    def __mul__(self, other):
+        return _product(operator.mul, self, other)
+
+    def __rmul__(self, other):
+        return _product(operator.mul, other, self)
+
+    def __div__(self, other):
+        return _product(operator.truediv, self, other)
+
+    __truediv__ = __div__  # Python 3.0 compatibility.
+
+    def __rdiv__(self, other):
+        return _product(operator.truediv, other, self)
+
+    __rtruediv__ = __rdiv__  # Python 3.0 compatibility.
+
+    def __floordiv__(self, other):
+        return _product(operator.floordiv, self, other)
+
+    def __rfloordiv__(self, other):
+        return _product(operator.floordiv, other, self)
+
+    def __pow__(self, other):
+        exponent = Unum.uniform(other)
+
+        if exponent._value:
+            exponent = exponent.copy(True)
+            exponent.assert_no_unit()
+
+        exponent = exponent._value
+        unit = self._unit ** exponent if exponent else EMPTY_SIGNATURE
+
+        return _create((operator.pow, self._expression, (None, exponent)), unit)
+
+    def __neg__(self):
+        return _create((operator.neg, self._expression), self._unit)
+
+    def __abs__(self):
+        return _create((operator.abs, self._expression), self._unit)
+
+    # the result is a new LazyUnum, values of operands are never modified
+    __iadd__ = __add__
+    __isub__ = __sub__
+    __imul__ = __mul__
+    __idiv__ = __itruediv__ = __div__
+
+
+def _create(expression, unit):
+    result = LazyUnum.__new__(LazyUnum)
+    result._expression, result._result = expression, _PENDING
+    result._unit, result._normal = unit, False
+
+    return result
+
+
+def _operand(value):
+    """
+    Return (expression, UnitSignature) of LazyUnum, Unum or unitless value.
+    """
+
+    if isinstance(value, LazyUnum):
+        return value._expression, value._unit
+
+    value, unit = _split(value)
+
+    return (None, value), unit
+
+
+def _scaled(expression, factor):
+    return expression if factor == 1 else (operator.mul, expression, (None, factor))
+
+
+def _sum(function, left, right):
+    """
+    Return LazyUnum of sum or difference of left and right expressed in common unit, see Unum.match_units.
+    """
+
+    s_expression, s_unit = _operand(left)
+    o_expression, o_unit = _operand(right)
+    unit = s_unit
+
+    if s_unit is not o_unit and _is_known_zero(left):
+        unit = o_unit
+    elif s_unit is not o_unit and not _is_known_zero(right):
+        s_length, o_length = len(s_unit), len(o_unit)
+
+        if s_length > o_length or (s_length == o_length and s_unit.max_level() < o_unit.max_level()):
+            factor, unit = s_unit.conversion_factor(o_unit), o_unit
+            s_expression = _scaled(s_expression, factor)
+        else:
+            factor = o_unit.conversion_factor(s_unit)
+            o_expression = _scaled(o_expression, factor)
+
+        if factor is None:
+            raise IncompatibleUnitsError(Unum.uniform(left), Unum.uniform(right))
+
+    return _create((function, s_expression, o_expression), unit)
+
+
+def _is_known_zero(value):
+    return not isinstance(value, LazyUnum) and _is_zero(_split(value)[0])
+
+
+def _product(function, left, right):
+    s_expression, s_unit = _operand(left)
+    o_expression, o_unit = _operand(right)
+    unit = s_unit * o_unit if function is operator.mul else s_unit / o_unit
+
+    return _create((function, s_expression, o_expression), unit)
+
+
+def _compute(expression, chunk_size):
+    """
+    Return value of expression, computing arrays in chunks of rows having about chunk_size elements.
+    """
+
+    arrays = _get_arrays(expression, [])
+
+    if not arrays:
+        return _evaluate(expression, None, {})
+
+    numpy = sys.modules['numpy']
+    shape = numpy.broadcast_shapes(*[array.shape for array in arrays])
+
+    if not shape:
+        return _evaluate(expression, None, {})
+
+    row_size = 1
+    for length in shape[1:]:
+        row_size *= length
+
+    rows = max(1, chunk_size // max(row_size, 1))
+
+    if rows >= shape[0]:
+        return _evaluate(expression, None, {})
+
+    result = None
+
+    for start in range(0, shape[0], rows):
+        chunk = _evaluate(expression, (slice(start, start + rows), shape), {})
+
+        if result is None:
+            result = numpy.empty(shape, chunk.dtype)
+
+        result[start:start + rows] = chunk
+
+    return result
+
+
+def _get_arrays(expression, arrays):
+    function, operands = expression[0], expression[1:]
+
+    if function is None:
+        numpy = sys.modules.get('numpy')
+
+        if numpy is not None and isinstance(operands[0], numpy.ndarray):
+            arrays.append(operands[0])
+        elif isinstance(operands[0], _Argument):
+            operands[0].used = True
+            raise TypeError("value of traced argument is not known")
+    else:
+        for operand in operands:
+            _get_arrays(operand, arrays)
+
+    return arrays
+
+
+def _evaluate(expression, chunk, cache):
+    """
+    :param chunk: None or (slice of rows, shape of result), arrays which span rows of result are sliced
+    :param cache: {id(expression): value} of expressions evaluated for the chunk
+    """
+
+    function, operands = expression[0], expression[1:]
+
+    if function is None:
+        return _select(operands[0], chunk)
+
+    try:
+        return cache[id(expression)]
+    except KeyError:
+        value = cache[id(expression)] = function(*[_evaluate(operand, chunk, cache) for operand in operands])
+        return value
+
+
+def _select(value, chunk):
+    if chunk is None:
+        return value
+
+    rows, shape = chunk
+    value_shape = getattr(value, 'shape', ())
+
+    if len(value_shape) == len(shape) and value_shape[0] != 1:
+        return value[rows]
+
+    return value
+
+
+class _Argument(object):
+    """
+    Value of argument of traced function, see trace.
+    """
+
+    __slots__ = ('index', 'used')
+
+    def __init__(self, index):
+        self.index, self.used = index, False
+
+
+def trace(function, args):
+    """
+    Call function with LazyUnum arguments of units of Unums of args, and compile the expression of the result.
+
+    Other arguments are passed to function as they are, so they're constants of the expression.
+
+    :param args: positional arguments
+    :return: (function of values of Unum arguments returning value of the result, unit of the result), or None
+        if function uses values of Unum arguments in other way than arithmetic, or it doesn't return a Unum
+    """
+
+    arguments = [_Argument(index) for index, arg in enumerate(arg for arg in args if isinstance(arg, Unum))]
+    placeholders = iter(arguments)
+
+    try:
+        result = function(*[
+            _create((None, next(placeholders)), arg._unit) if isinstance(arg, Unum) else arg for arg in args
+        ])
+    except Exception:
+        return None
+
+    if not isinstance(result, LazyUnum) or result.is_computed() or any(argument.used for argument in arguments):
+        return None
+
+    constants = {'abs': abs}
+    source = 'lambda %s: %s' % (
+        ', '.join('a%d' % argument.index for argument in arguments), _source(result._expression, constants),
+    )
+
+    code = compile(source, '<traced %s>' % getattr(function, '__name__', 'function'), 'eval',
+                   __future__.division.compiler_flag, True)
+
+    return eval(code, constants), result._unit
+
+
+_SYMBOLS = {
+    operator.add: '+', operator.sub: '-', operator.mul: '*', operator.truediv: '/', operator.floordiv: '//',
+    operator.pow: '**',
+}
+
+
+def _source(expression, constants):
+    """
+    Return Python source of expression, where constants are names of values in constants.
+    """
+
+    function, operands = expression[0], expression[1:]
+
+    if function is None and isinstance(operands[0], _Argument):
+        return 'a%d' % operands[0].index
+
+    if not _has_arguments(expression):
+        name = 'c%d' % len(constants)
+        constants[name] = _evaluate(expression, None, {})
+        return name
+
+    sources = [_source(operand, constants) for operand in operands]
+
+    if function is operator.neg:
+        return '(-%s)' % sources[0]
+
+    if function is operator.abs:
+        return 'abs(%s)' % sources[0]
+
+    return '(%s %s %s)' % (sources[0], _SYMBOLS[function], sources[1])
+
+
+def _has_arguments(expression):
+    function, operands = expression[0], expression[1:]
+
+    if function is None:
+        return isinstance(operands[0], _Argument)
+
+    return any(_has_arguments(operand) for operand in operands)
@@ -0,0 +1,133 @@
+"""Files of Unums with numpy array values, which can be memory-mapped.
+
+A file has a short header with the unit followed by the array in .npy format, so values larger
+than memory can be opened as Unums wrapping numpy.memmap, and only the used parts are read:
+
+    >>> save('readings.unum', mA * samples)
+    >>> readings = load('readings.unum')  # Unum wrapping numpy.memmap
+    >>> readings[:1000].number(A)
+"""
+from __future__ import division
+
+import ast
+import json
+import mmap
+import struct
+
+import numpy
+import numpy.lib.format
+
+from .core import _new_unum, _registered_signature, _split
+from .exceptions import UnumError
+
+MAGIC = b'\x93UNUM\x01'
+
+# header length
+_LENGTH = struct.Struct('<I')
+
+# the array follows the header at a multiple of it, and .npy format keeps its data aligned to it too
+_ALIGNMENT = 64
+
+
+def save(path, value):
+    """
+    Write Unum (or unitless value) with array-like value to file.
+
+    :param path: name of the file
+    """
+
+    value, unit = _split(value)
+    header = json.dumps({'unit': dict(unit)}, sort_keys=True).encode('utf-8')
+    header += b' ' * (-(len(MAGIC) + _LENGTH.size + len(header)) % _ALIGNMENT)  # aligns memory-mapped values
+
+    with open(path, 'wb') as stream:
+        stream.write(MAGIC)
+        stream.write(_LENGTH.pack(len(header)))
+        stream.write(header)
+        numpy.lib.format.write_array(stream, numpy.asanyarray(value), allow_pickle=False)
+
+
+def load(path, mmap_mode='r'):
+    """
+    Return Unum stored in file by save.
+
+    :param path: name of the file
+    :param mmap_mode: mode of numpy.memmap wrapped by the result ('r', 'r+' or 'c'), or None to read
+        the array into memory
+    :raises UnumError: if the file wasn't written by save, or its array has unknown version of .npy format
+    :raises UnknownUnitError: if a unit of the file isn't defined (modules of units are loaded, see unum.units)
+    """
+
+    with open(path, 'rb') as stream:
+        if stream.read(len(MAGIC)) != MAGIC:
+            raise UnumError("%s is not a file of Unum" % path)
+
+        length, = _LENGTH.unpack(stream.read(_LENGTH.size))
+        unit = json.loads(stream.read(length).decode('utf-8'))['unit']
+        unit = _registered_signature(*[item for pair in unit.items() for item in pair])
+
+        start = stream.tell()
+        shape, fortran_order, dtype = _read_array_header(stream, path)
+
+        if mmap_mode is None:
+            stream.seek(start)
+            return _new_unum(numpy.lib.format.read_array(stream, allow_pickle=False), unit)
+
+        offset = stream.tell()
+
+    array = numpy.memmap(path, dtype, mmap_mode, offset, shape, 'F' if fortran_order else 'C')
+
+    return _new_unum(array, unit)
+
+
+def _read_array_header(stream, path):
+    """
+    Return (shape, fortran_order, dtype) of .npy array header of stream.
+    """
+
+    version = numpy.lib.format.read_magic(stream)
+
+    if version == (1, 0):
+        return numpy.lib.format.read_array_header_1_0(stream)
+
+    if version == (2, 0):
+        return numpy.lib.format.read_array_header_2_0(stream)
+
+    if version == (3, 0):  # 2.0 with UTF-8 encoded header, numpy doesn't have a public reader of it
+        length, = _LENGTH.unpack(stream.read(_LENGTH.size))
+        header = ast.literal_eval(stream.read(length).decode('utf-8'))
+
+        return header['shape'], header['fortran_order'], numpy.lib.format.descr_to_dtype(header['descr'])
+
+    raise UnumError("%s has array of unknown .npy format version %d.%d" % ((path,) + version))
+
+
+class _MappedArray(object):
+    """
+    Pickled reference to the file of numpy.memmap, which is unpickled as numpy.memmap of the same file.
+    """
+
+    __slots__ = ('array',)
+
+    def __init__(self, array):
+        self.array = array
+
+    def __reduce__(self):
+        array = self.array
+        order = 'F' if array.flags.f_contiguous and not array.flags.c_contiguous else 'C'
+        mode = 'r' if array.mode == 'r' else 'r+'
+
+        return numpy.memmap, (array.filename, array.dtype, mode, array.offset, array.shape, order)
+
+
+def pickled_value(value):
+    """
+    Return value, or reference to the file if value is numpy.memmap of a whole file mapping, which
+    writes changes to the file (so pickle doesn't copy the data).
+    """
+
+    if isinstance(value, numpy.memmap) and isinstance(value.base, mmap.mmap) and value.filename and \
+            value.mode in ('r', 'r+', 'w+'):
+        return _MappedArray(value)
+
+    return value
@@ -0,0 +1,209 @@
+"""Chunked processing of quantity data larger than memory.
+
+Data is read as a stream of Unums of numpy arrays having a fixed number of elements, which are
+converted and reduced one by one, so memory use doesn't depend on the size of the data:
+
+    >>> readings = read('readings.unum', size=100000)  # file written by unum.storage.save
+    >>> power = (chunk * (230 * V) for chunk in readings)
+    >>> summary = summarize(convert(power, kW))
+    >>> summary.mean, summary.maximum
+"""
+from __future__ import division
+
+import itertools
+
+import numpy
+import six
+
+from .core import EMPTY_SIGNATURE, Unum, _new_unum, _split
+from .exceptions import IncompatibleUnitsError, NonBasicUnitError, UnumError
+from .storage import load
+from .utils import as_numbers, is_unit
+
+# default number of elements of chunk
+CHUNK_SIZE = 65536
+
+
+def read(source, unit=None, size=CHUNK_SIZE, dtype=float):
+    """
+    Return iterator over Unums of chunks of source having size elements (the last one can be shorter).
+
+    :param source: name of file written by unum.storage.save, Unum (e.g. loaded by unum.storage.load),
+        binary file object of raw values of dtype, or iterable of numbers or Unums
+    :param unit: unit of values of binary file and numbers, and unit to which Unums of file, Unum source and
+        Unums of iterable are converted (by default unit of Unum source, or of the first value of iterable)
+    :param dtype: type of values of binary file, or of chunks of iterable
+    :raises UnumError: if binary file ends with a part of value
+    :raises IncompatibleUnitsError: if Unum source or file can't be converted to unit
+    """
+
+    if unit is not None and not is_unit(unit):
+        raise NonBasicUnitError(unit)
+
+    if isinstance(source, six.string_types):
+        source = load(source)
+
+    if isinstance(source, Unum):
+        if unit is None:
+            return source.chunks(size)
+
+        if source._unit.conversion_factor(unit._unit) is None:
+            raise IncompatibleUnitsError(source.unit(), unit)
+
+        return convert(source.chunks(size), unit)
+
+    if hasattr(source, 'read'):
+        return _read_binary(source, EMPTY_SIGNATURE if unit is None else unit._unit, size, numpy.dtype(dtype))
+
+    return _read_values(iter(source), unit, size, dtype)
+
+
+def _read_binary(stream, unit, size, dtype):
+    while True:
+        data = stream.read(size * dtype.itemsize)
+
+        if not data:
+            return
+
+        while len(data) % dtype.itemsize:  # stream can return less bytes than requested before its end
+            rest = stream.read(dtype.itemsize - len(data) % dtype.itemsize)
+
+            if not rest:
+                raise UnumError("unexpected end of stream in a value of %s" % dtype)
+
+            data += rest
+
+        yield _new_unum(numpy.frombuffer(data, dtype, len(data) // dtype.itemsize), unit)
+
+
+def _read_values(iterator, unit, size, dtype):
+    while True:
+        values = list(itertools.islice(iterator, size))
+
+        if not values:
+            return
+
+        if unit is None:
+            unit = _new_unum(1, _split(values[0])[1])
+
+        indexes = [index for index, value in enumerate(values) if isinstance(value, Unum)]
+
+        if len(indexes) == len(values):
+            array = as_numbers(values, unit, dtype)
+        else:  # numbers are values in unit, so only Unums are converted
+            array = numpy.asarray([0 if isinstance(value, Unum) else value for value in values], dtype)
+
+            if indexes:
+                numbers = as_numbers([values[index] for index in indexes], unit, dtype)
+                array = array.astype(numpy.result_type(array, numbers), copy=False)
+                array[indexes] = numbers
+
+        yield _new_unum(array, unit._unit)
+
+
+def convert(chunks, unit):
+    """
+    Return iterator over chunks converted to unit, each one is multiplied by the conversion factor at once.
+
+    :raises IncompatibleUnitsError: if a chunk can't be converted to unit
+    """
+
+    if not is_unit(unit):
+        raise NonBasicUnitError(unit)
+
+    target = unit._unit
+
+    for chunk in chunks:
+        value, source = _split(chunk)
+        factor = source.conversion_factor(target)  # cached for every pair of units
+
+        if factor is None:
+            raise IncompatibleUnitsError(_new_unum(value, source), unit)
+
+        yield _new_unum(value if factor == 1 else value * factor, target)
+
+
+class Summary(object):
+    """
+    Running count, sum, minimum and maximum of values of chunks, computed in the unit of the first chunk,
+    or in the given unit.
+    """
+
+    __slots__ = ('_unit', 'count', '_total', '_minimum', '_maximum')
+
+    def __init__(self, unit=None):
+        if unit is not None and not is_unit(unit):
+            raise NonBasicUnitError(unit)
+
+        self._unit = None if unit is None else unit._unit
+        self.count, self._total, self._minimum, self._maximum = 0, 0, None, None
+
+    def update(self, chunk):
+        """
+        Add values of chunk (Unum or unitless array) to the summary.
+        """
+
+        value, unit = _split(chunk)
+        value = numpy.asarray(value)
+
+        if self._unit is None:
+            self._unit = unit
+        elif unit is not self._unit:
+            factor = unit.conversion_factor(self._unit)
+
+            if factor is None:
+                raise IncompatibleUnitsError(_new_unum(value, unit), _new_unum(1, self._unit))
+
+            value = value * factor
+
+        if not value.size:
+            return
+
+        minimum, maximum = value.min(), value.max()
+
+        self.count += value.size
+        self._total += value.sum()
+        self._minimum = minimum if self._minimum is None else min(self._minimum, minimum)
+        self._maximum = maximum if self._maximum is None else max(self._maximum, maximum)
+
+    def _result(self, value):
+        return _new_unum(value, EMPTY_SIGNATURE if self._unit is None else self._unit)
+
+    @property
+    def total(self):
+        return self._result(self._total)
+
+    @property
+    def minimum(self):
+        return None if self._minimum is None else self._result(self._minimum)
+
+    @property
+    def maximum(self):
+        return None if self._maximum is None else self._result(self._maximum)
+
+    @property
+    def mean(self):
+        return None if not self.count else self._result(self._total / self.count)
+
+
+def feed(chunks, summary):
+    """
+    Return iterator over chunks, which adds them to summary when they are yielded.
+    """
+
+    for chunk in chunks:
+        summary.update(chunk)
+        yield chunk
+
+
+def summarize(chunks, unit=None):
+    """
+    Return Summary of all chunks.
+    """
+
+    summary = Summary(unit)
+
+    for chunk in chunks:
+        summary.update(chunk)
+
+    return summary
@@ -1,8 +1,14 @@
-"""Units module: provide access to all the units with one import."""
-
-from unum.units.others import *
-from unum.units.custom import *
-
-from unum import Unum
-unitless = Unum(1)
-del Unum
+"""Units module: provide access to all the units with one import.
+
+Unit modules are imported on first access to their units, or by star-import. Symbols missing
+in the unit table are looked up in the index of unit modules, and the defining module is imported.
+"""
+
+from unum.units._loader import install, load_unit
+
+install(__name__, ['unum.units.si', 'unum.units.others', 'unum.units.custom'])
+
+from unum import UNIT_TABLE, Unum
+UNIT_TABLE.loader = load_unit
+unitless = 1.0 if UNIT_TABLE.erased else Unum(1)
+del UNIT_TABLE, Unum, install, load_unit
@@ -0,0 +1,233 @@
+"""Modules of unit symbols and of attributes of unit packages.
+
+Generated by unum.units._loader.write_index, don't edit.
+"""
+
+# {unit symbol: module defining it}
+UNITS = {
+    "'": 'unum.units.others',
+    "''": 'unum.units.others',
+    'A': 'unum.units.si.base',
+    'Bq': 'unum.units.si.derived',
+    'C': 'unum.units.si.derived',
+    'Ci': 'unum.units.others',
+    'F': 'unum.units.si.derived',
+    'GPa': 'unum.units.custom.mechanical',
+    'Gy': 'unum.units.si.derived',
+    'H': 'unum.units.si.derived',
+    'Hz': 'unum.units.si.derived',
+    'J': 'unum.units.si.derived',
+    'K': 'unum.units.si.base',
+    'L': 'unum.units.others',
+    'MN': 'unum.units.custom.mechanical',
+    'MNm': 'unum.units.custom.mechanical',
+    'MPa': 'unum.units.custom.mechanical',
+    'N': 'unum.units.si.derived',
+    'Np': 'unum.units.others',
+    'Pa': 'unum.units.si.derived',
+    'R': 'unum.units.others',
+    'S': 'unum.units.si.derived',
+    'Sv': 'unum.units.si.derived',
+    'T': 'unum.units.si.derived',
+    'V': 'unum.units.si.derived',
+    'W': 'unum.units.si.derived',
+    'Wb': 'unum.units.si.derived',
+    'a': 'unum.units.others',
+    'acre': 'unum.units.imp_UK',
+    'angstrom': 'unum.units.others',
+    'b': 'unum.units.others',
+    'bar': 'unum.units.others',
+    'barleycorn': 'unum.units.imp_UK',
+    'blank': 'unum.units.imp_UK.troy.mint',
+    'bushel': 'unum.units.imp_UK',
+    'cable': 'unum.units.imp_UK',
+    'cd': 'unum.units.si.base',
+    'ch': 'unum.units.imp_UK',
+    'cubit': 'unum.units.imp_UK',
+    'cwt': 'unum.units.imp_UK.avoirdupois',
+    'd': 'unum.units.others',
+    'dB': 'unum.units.others',
+    'deg': 'unum.units.others',
+    'deg C': 'unum.units.si.derived',
+    'digit': 'unum.units.imp_UK',
+    'dr': 'unum.units.imp_UK.avoirdupois',
+    'dr ap': 'unum.units.imp_UK.Apothecaries',
+    'droit': 'unum.units.imp_UK.troy.mint',
+    'eV': 'unum.units.others',
+    'ell': 'unum.units.imp_UK',
+    'finger': 'unum.units.imp_UK',
+    'fl d': 'unum.units.imp_UK',
+    'fl dr (US)': 'unum.units.US_Customary',
+    'fl drachm ap': 'unum.units.imp_UK.Apothecaries',
+    'fl oz': 'unum.units.imp_UK',
+    'fl scruple ap': 'unum.units.imp_UK.Apothecaries',
+    'ft': 'unum.units.imp_UK',
+    'ftm': 'unum.units.imp_UK',
+    'fur': 'unum.units.imp_UK',
+    'g': 'unum.units.si.base',
+    'g0': 'unum.units.others',
+    'gal': 'unum.units.imp_UK',
+    'gf': 'unum.units.custom.mechanical',
+    'gi': 'unum.units.imp_UK',
+    'gr': 'unum.units.imp_UK.avoirdupois',
+    'gr ap': 'unum.units.imp_UK.Apothecaries',
+    'gr t': 'unum.units.imp_UK.troy',
+    'grade': 'unum.units.imp_UK',
+    'gunters chain': 'unum.units.imp_UK',
+    'h': 'unum.units.others',
+    'ha': 'unum.units.others',
+    'hand': 'unum.units.imp_UK',
+    'inch': 'unum.units.imp_UK',
+    'kN': 'unum.units.custom.mechanical',
+    'kNcm': 'unum.units.custom.mechanical',
+    'kNm': 'unum.units.custom.mechanical',
+    'kPa': 'unum.units.custom.mechanical',
+    'kat': 'unum.units.si.derived',
+    'kg': 'unum.units.si.base',
+    'kgf': 'unum.units.custom.mechanical',
+    'knot': 'unum.units.others',
+    'lb': 'unum.units.imp_UK.avoirdupois',
+    'lb ap': 'unum.units.imp_UK.Apothecaries',
+    'lb f': 'unum.units.imp_UK',
+    'lb m': 'unum.units.imp_UK.metric',
+    'lb t': 'unum.units.imp_UK.troy',
+    'lea': 'unum.units.imp_UK',
+    'line': 'unum.units.imp_UK',
+    'link': 'unum.units.imp_UK',
+    'lm': 'unum.units.si.derived',
+    'lx': 'unum.units.si.derived',
+    'm': 'unum.units.si.base',
+    'mi': 'unum.units.imp_UK',
+    'mile': 'unum.units.others',
+    'min': 'unum.units.others',
+    'minim': 'unum.units.imp_UK',
+    'minim ap': 'unum.units.imp_UK.Apothecaries',
+    'mite': 'unum.units.imp_UK.troy.mint',
+    'mol': 'unum.units.si.base',
+    'nail': 'unum.units.imp_UK',
+    'naleague': 'unum.units.imp_UK',
+    'namile': 'unum.units.imp_UK',
+    'nmi': 'unum.units.others',
+    'ohm': 'unum.units.si.derived',
+    'oz': 'unum.units.imp_UK.avoirdupois',
+    'oz ap': 'unum.units.imp_UK.Apothecaries',
+    'oz t': 'unum.units.imp_UK.troy',
+    'pace': 'unum.units.imp_UK',
+    'palm': 'unum.units.imp_UK',
+    'peck': 'unum.units.imp_UK',
+    'perch': 'unum.units.imp_UK',
+    'perit': 'unum.units.imp_UK.troy.mint',
+    'pica': 'unum.units.imp_UK',
+    'point': 'unum.units.imp_UK',
+    'poppyseed': 'unum.units.imp_UK',
+    'pt': 'unum.units.imp_UK',
+    'pwt': 'unum.units.imp_UK.troy',
+    'qt': 'unum.units.imp_UK',
+    'qtr': 'unum.units.imp_UK.avoirdupois',
+    'rad': 'unum.units.si.derived',
+    'ramsdens chain': 'unum.units.imp_UK',
+    'rem': 'unum.units.others',
+    'rod': 'unum.units.imp_UK',
+    'roman mile': 'unum.units.imp_UK',
+    'rood': 'unum.units.imp_UK',
+    'rope': 'unum.units.imp_UK',
+    's': 'unum.units.si.base',
+    's ap': 'unum.units.imp_UK.Apothecaries',
+    's cwt': 'unum.units.imp_UK.avoirdupois',
+    'shackle': 'unum.units.imp_UK',
+    'shaftment': 'unum.units.imp_UK',
+    'short ton': 'unum.units.imp_UK.avoirdupois',
+    'skein': 'unum.units.imp_UK',
+    'slug': 'unum.units.imp_UK.avoirdupois',
+    'span': 'unum.units.imp_UK',
+    'spindle': 'unum.units.imp_UK',
+    'sr': 'unum.units.si.derived',
+    'st': 'unum.units.imp_UK.avoirdupois',
+    'stick': 'unum.units.imp_UK',
+    't': 'unum.units.others',
+    'tf': 'unum.units.custom.mechanical',
+    'th': 'unum.units.imp_UK',
+    'ton': 'unum.units.imp_UK.avoirdupois',
+    'twip': 'unum.units.imp_UK',
+    'u': 'unum.units.others',
+    'ua': 'unum.units.others',
+    'yd': 'unum.units.imp_UK',
+}
+
+# {prefix: module defining it}
+PREFIXES = {
+    'E': 'unum.units.si.base',
+    'G': 'unum.units.si.base',
+    'M': 'unum.units.si.base',
+    'P': 'unum.units.si.base',
+    'Q': 'unum.units.si.base',
+    'R': 'unum.units.si.base',
+    'T': 'unum.units.si.base',
+    'Y': 'unum.units.si.base',
+    'Z': 'unum.units.si.base',
+    'a': 'unum.units.si.base',
+    'c': 'unum.units.si.base',
+    'd': 'unum.units.si.base',
+    'da': 'unum.units.si.base',
+    'f': 'unum.units.si.base',
+    'h': 'unum.units.si.base',
+    'k': 'unum.units.si.base',
+    'm': 'unum.units.si.base',
+    'n': 'unum.units.si.base',
+    'p': 'unum.units.si.base',
+    'q': 'unum.units.si.base',
+    'r': 'unum.units.si.base',
+    'u': 'unum.units.si.base',
+    'y': 'unum.units.si.base',
+    'z': 'unum.units.si.base',
+}
+
+# {package: {module: space-separated names of attributes of package taken from the module}}
+EXPORTS = {
+    'unum.units': {
+        'unum.units.custom': (
+            'GPa MN MNm MPa kG kN kNcm kNm kPa'
+        ),
+        'unum.units.others': (
+            'ANGSTROM ARCDEG ARCMIN ARCSEC ARE AU B BAR CI Ci D DECIBEL EV H HA KNOT L MILE MIN NMILE NP Np R REM '
+            'TON U UA a angstrom arcmin arcsec b bar d dB deg eV g0 h ha knot mile minutes new_unit nmile pi rem '
+            'standard_gravity t u ua'
+        ),
+        'unum.units.si': (
+            'A AA ACD AG AK AM AMOL BQ Bq C CA CCD CD CELSIUS CG CK CM CMOL DA DAA DACD DAG DAK DAM DAMOL DCD DG '
+            'DK DM DMOL EA ECD EG EK EM EMOL Ecd Eg Em Emol Es F FA FCD FG FK FM FMOL GA GCD GG GK GM GMOL GY Gcd '
+            'Gg Gm Gmol Gs Gy HCD HENRY HG HK HM HMOL HZ Hz J K KA KAT KCD KG KK KM KMOL LM LX M MA MCD MG MK MM '
+            'MMOL MOL Mcd Mg Mm Mmol Ms N NA NCD NG NK NM NMOL OHM PA PCD PG PK PM PMOL Pa Pcd Pg Pm Pmol Ps QA '
+            'QCD QG QK QM QMOL Qcd Qg Qm Qmol Qs RA RAD RCD RG RK RM RMOL Rcd Rg Rm Rmol Rs S SIEMENS SR SV Sv T '
+            'TA TCD TG TK TM TMOL Tcd Tg Tm Tmol Ts UCD UG UK UM UMOL V W WB Wb YA YCD YG YK YM YMOL Ycd Yg Ym '
+            'Ymol Ys ZA ZCD ZG ZK ZM ZMOL Zcd Zg Zm Zmol Zs aA aK acd ag am amol cA cK ccd cd celsius cg cm cmol '
+            'cs dA dK daA daK dacd dag dam damol das dcd dg dm dmol ds fA fK fcd fg fm fmol fs g hA hK hcd hg hm '
+            'hmol hs kA kK kat kcd kg km kmol ks lm lx m mA mK mcd mg mm mmol mol ms nA nK ncd ng nm nmol ns ohm '
+            'pA pK pcd pg pm pmol ps qA qK qcd qg qm qmol qs rA rK rad rcd rg rm rmol rs s sr uA uK ucd ug um '
+            'umol us yA yK ycd yg ym ymol ys zA zK zcd zg zm zmol zs'
+        ),
+    },
+    'unum.units.custom': {
+        'unum.units.custom.mechanical': (
+            'GPa MN MNm MPa T kG kN kNcm kNm kPa'
+        ),
+    },
+    'unum.units.si': {
+        'unum.units.si.base': (
+            'A AA ACD AG AK AM AMOL CA CCD CD CG CK CM CMOL DA DAA DACD DAG DAK DAM DAMOL DCD DG DK DM DMOL EA '
+            'ECD EG EK EM EMOL Ecd Eg Em Emol Es FA FCD FG FK FM FMOL GA GCD GG GK GM GMOL Gcd Gg Gm Gmol Gs HA '
+            'HCD HG HK HM HMOL K KA KCD KG KK KM KMOL M MA MCD MG MK MM MMOL MOL Mcd Mg Mm Mmol Ms NA NCD NG NK '
+            'NM NMOL PCD PG PK PM PMOL Pcd Pg Pm Pmol Ps QA QCD QG QK QM QMOL Qcd Qg Qm Qmol Qs RA RCD RG RK RM '
+            'RMOL Rcd Rg Rm Rmol Rs TA TCD TG TK TM TMOL Tcd Tg Tm Tmol Ts UA UCD UG UK UM UMOL YA YCD YG YK YM '
+            'YMOL Ycd Yg Ym Ymol Ys ZA ZCD ZG ZK ZM ZMOL Zcd Zg Zm Zmol Zs aA aK acd ag am amol cA cK ccd cd cg '
+            'cm cmol cs dA dK daA daK dacd dag dam damol das dcd dg dm dmol ds fA fK fcd fg fm fmol fs g hA hK '
+            'hcd hg hm hmol hs kA kK kcd kg km kmol ks m mA mK mcd mg mm mmol mol ms nA nK ncd ng nm nmol ns pA '
+            'pK pcd pg pm pmol ps qA qK qcd qg qm qmol qs rA rK rcd rg rm rmol rs s uA uK ucd ug um umol us yA yK '
+            'ycd yg ym ymol ys zA zK zcd zg zm zmol zs'
+        ),
+        'unum.units.si.derived': (
+            'BQ Bq C CELSIUS F GY Gy H HENRY HZ Hz J KAT LM LX N OHM PA Pa RAD S SIEMENS SR SV Sv T V W WB Wb '
+            'celsius kat lm lx ohm rad sr'
+        ),
+    },
+}
@@ -0,0 +1,301 @@
+"""Load unit modules on first access to their units.
+
+Modules defining attributes of packages and unit symbols are looked up in unum.units._index,
+which is generated by write_index.
+
+Python < 3.7 doesn't support module level __getattr__, so there all modules are loaded at once.
+"""
+import importlib
+import sys
+import types
+
+_PACKAGE = 'unum.units'
+
+_packages = {}  # {package: module names} of installed packages
+
+
+def install(package, sources):
+    """
+    Make attributes of unit modules available as attributes of package, importing modules on first access.
+
+    Star-import of package imports all modules.
+
+    :param package: name of package
+    :param sources: names of modules in the order in which they would be star-imported by package
+    """
+
+    module = sys.modules[package]
+    _packages[package] = sources
+
+    if sys.version_info < (3, 7):
+        for source in sources:
+            _copy_public(_load(source, package), module)
+        return
+
+    from unum.units._index import EXPORTS
+    exports = dict((name, source) for source, names in EXPORTS.get(package, {}).items() for name in names.split())
+
+    def __getattr__(name):
+        if name == '__all__':
+            value = _public_names(sources, package, module)
+        elif name.startswith('_'):
+            raise AttributeError("module %r has no attribute %r" % (package, name))
+        else:
+            value = _find(name, exports.get(name), sources, package)
+
+        setattr(module, name, value)
+
+        return value
+
+    def __dir__():
+        return sorted(set(vars(module)).union(exports))
+
+    module.__getattr__ = __getattr__
+    module.__dir__ = __dir__
+
+
+def install_prefixed(package, items):
+    """
+    Make prefixed units attributes of module, which are got from the unit table on first access.
+
+    :param package: name of module
+    :param items: strings of space-separated attribute names, the first one is the symbol of prefixed unit,
+        names of later items override the earlier ones
+    """
+
+    from unum.core import get_unit
+
+    module = sys.modules[package]
+    symbols = {}  # {name: symbol}
+
+    for item in items:
+        names = item.split()
+
+        for name in names:
+            symbols[name] = names[0]
+
+    aliases = {}  # {symbol: names}
+
+    for name, symbol in symbols.items():
+        aliases.setdefault(symbol, []).append(name)
+
+    if sys.version_info < (3, 7):
+        for name, symbol in symbols.items():
+            setattr(module, name, get_unit(symbol))
+        return
+
+    def __getattr__(name):
+        try:
+            symbol = symbols[name]
+        except KeyError:
+            raise AttributeError("module %r has no attribute %r" % (package, name))
+
+        value = get_unit(symbol)
+
+        for alias in aliases[symbol]:  # aliases are the same Unum
+            setattr(module, alias, value)
+
+        return value
+
+    def __dir__():
+        return sorted(set(vars(module)).union(symbols))
+
+    module.__getattr__ = __getattr__
+    module.__dir__ = __dir__
+
+
+def load_unit(symbol):
+    """
+    Import the module defining unit symbol, or modules of prefix and base unit of prefixed symbol.
+
+    :return: True if a module was imported
+    """
+
+    from unum.units._index import PREFIXES, UNITS
+
+    sources = [UNITS.get(symbol)]
+
+    if sources[0] is None:
+        sources = [
+            (PREFIXES[symbol[:length]], UNITS[symbol[length:]]) for length in range(1, len(symbol))
+            if symbol[:length] in PREFIXES and symbol[length:] in UNITS
+        ][:1]
+        sources = sources[0] if sources else []
+
+    imported = False
+
+    for source in sources:
+        if source not in sys.modules:
+            _load(source, _PACKAGE)
+            imported = True
+
+    return imported
+
+
+def _find(name, source, sources, package):
+    if source is not None:
+        try:
+            return getattr(_load(source, package), name)
+        except AttributeError:  # index is out of date
+            pass
+
+    try:
+        return _load('.' + name, package)
+    except ImportError as error:
+        if getattr(error, 'name', None) != package + '.' + name:
+            raise
+
+    for source in reversed(sources):
+        source_module = _load(source, package)
+
+        if hasattr(source_module, name):
+            return getattr(source_module, name)
+
+    raise AttributeError("module %r has no attribute %r" % (package, name))
+
+
+def _public_names(sources, package, module):
+    """
+    Return public names of package, and set attributes of all modules as star-imports would do it.
+    """
+
+    names = _get_defined(module)
+    defined = set(names)
+    known = set(names)
+
+    for source in sources:
+        source_module = _load(source, package)
+
+        for name in _get_public(source_module):
+            if name not in defined:
+                setattr(module, name, getattr(source_module, name))
+
+            if name not in known:
+                known.add(name)
+                names.append(name)
+
+    return names
+
+
+def _get_public(module):
+    try:
+        return list(module.__all__)
+    except AttributeError:
+        return _get_defined(module)
+
+
+def _get_defined(module):
+    return [
+        name for name, value in vars(module).items()
+        if not name.startswith('_') and not isinstance(value, types.ModuleType)
+    ]
+
+
+def _copy_public(source, target):
+    for name in _get_public(source):
+        setattr(target, name, getattr(source, name))
+
+
+def _load(name, package):
+    return importlib.import_module(name, package)
+
+
+def build_index():
+    """
+    Import all unit modules and return {name of _index attribute: value}.
+
+    Must be called before any unit module is imported.
+    """
+
+    import pkgutil
+    import unum
+    import unum.core
+
+    units, prefixes = {}, {}
+
+    def recorded(define, index):
+        def wrapper(symbol, *args, **kwargs):
+            index[symbol] = sys._getframe(1).f_globals['__name__']
+            return define(symbol, *args, **kwargs)
+
+        return wrapper
+
+    unum.new_unit = unum.core.new_unit = recorded(unum.core.new_unit, units)
+    unum.new_prefix = unum.core.new_prefix = recorded(unum.core.new_prefix, prefixes)
+
+    root = _load(_PACKAGE, None)
+
+    for _, name, _ in pkgutil.walk_packages(root.__path__, _PACKAGE + '.'):
+        if not name.rpartition('.')[2].startswith('_') and not name.endswith('.tests'):
+            _load(name, None)
+
+    exports = {}  # {package: {name: module}}
+
+    for package, sources in _packages.items():
+        names = exports[package] = {}
+
+        for source in sources:
+            source_module = _load(source, None)
+
+            for name in _get_public(source_module):
+                current = names.get(name)
+
+                # the earliest module giving the value of the last star-import
+                if current is None or getattr(_load(current, None), name) is not getattr(source_module, name):
+                    names[name] = source
+
+    grouped = {}
+
+    for package, names in exports.items():
+        for name, source in names.items():
+            grouped.setdefault(package, {}).setdefault(source, []).append(name)
+
+    return {
+        'UNITS': units,
+        'PREFIXES': prefixes,
+        'EXPORTS': dict(
+            (package, dict((source, ' '.join(sorted(names))) for source, names in sources.items()))
+            for package, sources in grouped.items()
+        ),
+    }
+
+
+def write_index(path=None):
+    """
+    Write unum.units._index, must be called in a new process before any unit module is imported:
+
+        python -c "from unum.units import _loader; _loader.write_index()"
+    """
+
+    import textwrap
+
+    index = build_index()
+    lines = [
+        '"""Modules of unit symbols and of attributes of unit packages.',
+        '',
+        'Generated by unum.units._loader.write_index, don\'t edit.',
+        '"""',
+    ]
+
+    for name, comment in [('UNITS', 'unit symbol: module defining it'), ('PREFIXES', 'prefix: module defining it')]:
+        lines += ['', '# {%s}' % comment, '%s = {' % name]
+        lines += ['    %r: %r,' % item for item in sorted(index[name].items())]
+        lines += ['}']
+
+    lines += ['', '# {package: {module: space-separated names of attributes of package taken from the module}}', 'EXPORTS = {']
+
+    for package, sources in sorted(index['EXPORTS'].items()):
+        lines += ['    %r: {' % package]
+
+        for source, names in sorted(sources.items()):
+            lines += ['        %r: (' % source]
+            wrapped = textwrap.wrap(names, 100)
+            lines += ['            %r' % (line + ' ') for line in wrapped[:-1]] + ['            %r' % wrapped[-1]]
+            lines += ['        ),']
+
+        lines += ['    },']
+
+    lines += ['}']
+
+    with open(path or __file__.replace('_loader', '_index').replace('.pyc', '.py'), 'w') as stream:
+        stream.write('\n'.join(lines) + '\n')
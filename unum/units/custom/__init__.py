@@ -1 +1,5 @@
-from .mechanical import *
\ No newline at end of file
+from unum.units._loader import install
+
+install(__name__, ['unum.units.custom.mechanical'])
+
+del install
@@ -13,6 +13,11 @@ as well as: https://www.britannica.com/topic/Imperial-unit
 from unum import new_unit
 from unum.units import m, mg, g,s
 from unum.units.others import g0
+from unum.units._loader import install
+
+# subpackages (Apothecaries, metric, troy) are imported on first access
+install(__name__, [])
+del install
 
 # << define your units hereafter, e.g.
 #    M  = new_unit(  'm' , 0          , 'meter'     )
@@ -1,4 +1,7 @@
-"""Importing this package gives you all the base and derived SI units."""
-
-from unum.units.si.base import *
-from unum.units.si.derived import *
+"""Importing this package gives you all the base and derived SI units."""
+
+from unum.units._loader import install
+
+install(__name__, ['unum.units.si.base', 'unum.units.si.derived'])
+
+del install
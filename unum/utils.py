@@ -1,14 +1,13 @@
-from .core import Unum
-from .exceptions import NonBasicUnitError
+from .core import EMPTY_SIGNATURE, UNIT_TABLE, UnitCache, Unum, _is_zero, _new_unum, _split
+from .exceptions import IncompatibleElementError, NonBasicUnitError
+
+# When units are erased (see unum.core.erase_units) numbers are quantities in basic units,
+# so helpers return them unchanged or divided by the value of target unit.
 
 
 def uarray(array_like, *args, **kwargs):
     """
     Convenience function to return a Unum containing a numpy array.
-    With current versions of numpy, we have the following undesirable behavior:
-    >>> from unum.units import M
-    >>> array([5,6,7,8]) * M
-    array([5 [m], 6 [m], 7 [m], 8 [m]], dtype=object)
 
     :param array_like: numpy array
     :param args: args given to numpy array
@@ -17,10 +16,111 @@ def uarray(array_like, *args, **kwargs):
     """
     from numpy import array
 
+    if UNIT_TABLE.erased:
+        return array(array_like, *args, **kwargs)
+
     return Unum.uniform(array(array_like, *args, **kwargs))
 
 
+def collapse(array, unit=None, dtype=None):
+    """
+    Return a Unum containing a typed numpy array of values of an object array (or nested sequence) of Unums.
+
+    Values are converted to one unit in a single pass over the elements, e.g. to repair arrays created
+    by older versions of numpy from array([5,6,7,8]) * M.
+
+    :param array: object array or sequence of Unums and unitless values
+    :param unit: unit of the result, by default unit of the first element
+    :param dtype: dtype of the result, by default inferred from values
+    :return: Unum containing numpy array
+    """
+    import numpy
+
+    if UNIT_TABLE.erased:
+        return numpy.array(array, dtype) if unit is None else numpy.array(array, dtype) / unit
+
+    items = numpy.asarray(array, dtype=object)
+    flat = items.ravel()
+
+    if unit is None:
+        unit = _new_unum(1, _split(flat[0])[1] if flat.size else EMPTY_SIGNATURE)
+
+    return _new_unum(as_numbers(flat, unit, dtype).reshape(items.shape), unit._unit)
+
+
+def as_numbers(values, unit, dtype=float, out=None):
+    """
+    Return numpy array of numeric values of Unums (or unitless values) converted to unit.
+
+    Values are grouped by their units, so a conversion factor is computed once for every unit,
+    and numbers are scaled by factors of their groups at once.
+
+    :param values: iterable of Unums and unitless values, unitless values other than 0 are compatible
+        only with unitless unit, zeros are compatible with any unit (with any unit of their own)
+    :param unit: unit for which numeric values are getting
+    :param dtype: dtype of the result, None means inferred from values and factors
+    :param out: preallocated numpy array filled with the result
+    :return: evaluated array (out if it is given)
+    :raises IncompatibleElementError: for the first value which can't be converted to unit, with its index
+    """
+    import numpy
+
+    if UNIT_TABLE.erased:
+        return numpy.divide(numpy.asarray(values, dtype), unit, out=out)
+
+    if not is_unit(unit):
+        raise NonBasicUnitError(unit)
+
+    target = unit._unit
+    groups = {}  # {UnitSignature: index of its group}
+    factors, numbers, indexes = [], [], []
+
+    for index, value in enumerate(values):
+        if isinstance(value, Unum):
+            number, source = value._value, value._unit
+        else:
+            number, source = value, EMPTY_SIGNATURE
+
+        try:
+            group = groups[source]
+        except KeyError:
+            factor = source.conversion_factor(target)
+
+            if factor is None:
+                if not _is_zero(number):
+                    raise IncompatibleElementError(index, _new_unum(number, source), unit)
+
+                source, factor = None, 1  # zero is compatible with any unit, as in as_number
+
+            group = groups.get(source)
+
+            if group is None:
+                group = groups[source] = len(factors)
+                factors.append(factor)
+
+        numbers.append(number)
+        indexes.append(group)
+
+    scales = None if all(factor == 1 for factor in factors) else numpy.asarray(factors, float)[indexes]
+
+    if out is None and dtype is None:
+        return numpy.asarray(numbers) if scales is None else numpy.multiply(numbers, scales)
+
+    if out is None:
+        out = numpy.empty(len(numbers), dtype)
+
+    if scales is None:
+        out[...] = numbers
+    else:
+        numpy.multiply(numbers, scales, out=out, casting='unsafe')
+
+    return out
+
+
 def unitless(*values):
+    if UNIT_TABLE.erased:
+        return iter(values)
+
     unit = Unum(1, values[0]._unit)
 
     return (value.asNumber(unit) for value in values)
@@ -31,6 +131,9 @@ def is_unit(value):
 
 
 def as_unum(value, unit=None):
+    if UNIT_TABLE.erased:
+        return value if unit is None else value * unit
+
     if unit is not None and not is_unit(unit):
         raise NonBasicUnitError(unit)
 
@@ -44,6 +147,9 @@ def as_unum(value, unit=None):
 
 
 def as_unit(value):
+    if UNIT_TABLE.erased:
+        return 1.0
+
     return value.unit() if isinstance(value, Unum) else Unum(1)
 
 
@@ -67,6 +173,8 @@ def as_number(value, *args, **kwargs):
 
     if isinstance(value, Unum):
         number = value.number(args[-1]) if len(args) > 0 else value.number()
+    elif UNIT_TABLE.erased and args:
+        number = value / args[-1]
     else:
         number = value
 
@@ -78,10 +186,70 @@ def as_number(value, *args, **kwargs):
     return number
 
 
+def compiled(function):
+    """
+    Decorator which runs function on numbers instead of Unums.
+
+    Function is traced once for every combination of units of Unum arguments and values of
+    other positional arguments, which checks units and records conversion factors, then the
+    result is computed from values of Unum arguments and only wrapped in a Unum. Other arguments
+    are passed to function as they are, so they can be used in conditions (e.g. None or flags).
+    Function should compute a Unum from its Unum arguments with arithmetic operators only;
+    functions which use their values in other way (e.g. comparisons, math functions) are called
+    as usual, as well as calls with keyword arguments, with unhashable other arguments (e.g.
+    arrays) or without Unum arguments, which return what function does for numbers. Unums used
+    by function are treated as constants.
+
+    :param function: function of Unums returning Unum
+    :return: decorated function
+    """
+    from functools import wraps
+    from .lazy import trace
+
+    if UNIT_TABLE.erased:
+        return function
+
+    # {units of Unum arguments and (type, value) of others: (function of values, unit of result) or None},
+    # traces are dropped when the unit table changes, because they record conversion factors
+    traced = UnitCache(UNIT_TABLE, max_size=256)
+
+    @wraps(function)
+    def decorator(*args, **kwargs):
+        if kwargs or not any(isinstance(arg, Unum) for arg in args):
+            return function(*args, **kwargs)
+
+        values, key = [], []
+
+        for arg in args:
+            if isinstance(arg, Unum):
+                values.append(arg._value)
+                key.append(arg._unit)
+            else:
+                key.append((type(arg), arg))
+
+        key = tuple(key)
+
+        try:
+            entry = traced[key]
+        except KeyError:
+            entry = traced[key] = trace(function, args)
+        except TypeError:  # unhashable argument
+            return function(*args)
+
+        if entry is None:
+            return function(*args)
+
+        compiled_function, unit = entry
+
+        return _new_unum(compiled_function(*values), unit)
+
+    return decorator
+
+
 def encode(number):
     if isinstance(number, Unum):
         value, unit, normal = number.__getstate__()
-        return [value, unit]
+        return [value, dict(unit)]
     else:
         return number
 